@@ -25,31 +25,64 @@ try:
 except ImportError:
     BLE_AVAILABLE = False
 
+try:
+    import keypad
+    KEYPAD_AVAILABLE = True
+except ImportError:
+    KEYPAD_AVAILABLE = False
+
+# MicroPython's ilistdir yields each entry's type with its name; CircuitPython
+# only has listdir
+_ilistdir = getattr(os, "ilistdir", None)
+
 # Display constants
 SCREEN_WIDTH = board.DISPLAY.width
 SCREEN_HEIGHT = board.DISPLAY.height
 STATUS_BAR_HEIGHT = 20
 MENU_START_Y = STATUS_BAR_HEIGHT + 10
 
+# supervisor.ticks_ms() wraps at 2**29; ints avoid boxing a float per poll
+_TICKS_PERIOD = 1 << 29
+_TICKS_HALF = _TICKS_PERIOD // 2
+APPS_SCAN_TTL = 300  # Seconds a saved app scan is trusted across soft reloads
+
+# App directories on flash, then common SD card mount points
+APP_SEARCH_PATHS = ("/apps", "/sd/apps", "/mnt/sd/apps", "/external/apps")
+# Root files never listed as standalone apps in developer mode
+ROOT_SYSTEM_FILES = ("code.py", "boot.py", "app_loader.py")
+
 def load_settings():
     """Load settings from settings.toml"""
     settings = {}
     try:
         with open("/settings.toml", "r") as f:
-            for line in f:
-                line = line.strip()
-                if "=" in line and not line.startswith("#"):
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    
-                    # Convert numeric values
-                    if value.isdigit():
+            for raw in f:
+                line = raw.strip()
+                # Blank lines, comments and section headers carry no key
+                if not line or line[0] in "#[" or "=" not in line:
+                    continue
+                
+                key, value = line.split("=", 1)
+                key = key.strip()
+                value = value.strip().strip('"').strip("'")
+                
+                # Convert boolean and numeric values
+                vl = value.lower()
+                if vl == "true":
+                    value = True
+                elif vl == "false":
+                    value = False
+                else:
+                    try:
                         value = int(value)
-                    elif value.lower() in ("true", "false"):
-                        value = value.lower() == "true"
-                    
-                    settings[key] = value
+                    except ValueError:
+                        if "." in value:
+                            try:
+                                value = float(value)
+                            except ValueError:
+                                pass
+                
+                settings[key] = value
     except Exception as e:
         print(f"Error loading settings: {e}")
     return settings
@@ -57,18 +90,35 @@ def load_settings():
 def save_settings(settings):
     """Save settings to settings.toml"""
     try:
+        parts = []
+        for key, value in settings.items():
+            if isinstance(value, bool):
+                parts.append(f"{key} = {str(value).lower()}\n")
+            elif isinstance(value, int):
+                parts.append(f"{key} = {value}\n")
+            else:
+                parts.append(f'{key} = "{value}"\n')
+        
         with open("/settings.toml", "w") as f:
-            for key, value in settings.items():
-                if isinstance(value, bool):
-                    f.write(f"{key} = {str(value).lower()}\n")
-                elif isinstance(value, int):
-                    f.write(f"{key} = {value}\n")
-                else:
-                    f.write(f'{key} = "{value}"\n')
+            f.write("".join(parts))
     except Exception as e:
         print(f"Error saving settings: {e}")
 
 
+def _ticks_diff(end, start):
+    """Milliseconds from start to end, allowing for ticks_ms() wraparound"""
+    return ((end - start + _TICKS_HALF) % _TICKS_PERIOD) - _TICKS_HALF
+
+
+def _update_label(text_label, text, color=None):
+    """Update a label only when its text or color actually changes"""
+    # Assigning .text re-lays out every glyph even when nothing changed
+    if text_label.text != text:
+        text_label.text = text
+    if color is not None and text_label.color != color:
+        text_label.color = color
+
+
 class StatusBar:
     def __init__(self, display_group):
         self.group = displayio.Group()
@@ -104,13 +154,14 @@ class StatusBar:
             terminalio.FONT, text="--:-- --", color=0xFFFF00, x=SCREEN_WIDTH - 70, y=12
         )
         self.group.append(self.time_label)
+        self._time_key = None
         
         self.display_group.append(self.group)
         
     def update_wifi_status(self):
         """Update WiFi status icon with signal quality"""
         if not WIFI_AVAILABLE:
-            self.wifi_label.text = ""
+            _update_label(self.wifi_label, "")
             return
             
         try:
@@ -118,41 +169,33 @@ class StatusBar:
                 # Show signal strength with different colors
                 rssi = wifi.radio.ap_info.rssi if wifi.radio.ap_info else -100
                 if rssi > -50:
-                    self.wifi_label.text = "WiFi+"
-                    self.wifi_label.color = 0x00FF00  # Green - excellent
+                    _update_label(self.wifi_label, "WiFi+", 0x00FF00)  # Green - excellent
                 elif rssi > -70:
-                    self.wifi_label.text = "WiFi"
-                    self.wifi_label.color = 0xFFFF00  # Yellow - good
+                    _update_label(self.wifi_label, "WiFi", 0xFFFF00)  # Yellow - good
                 else:
-                    self.wifi_label.text = "WiFi-"
-                    self.wifi_label.color = 0xFF8000  # Orange - weak
+                    _update_label(self.wifi_label, "WiFi-", 0xFF8000)  # Orange - weak
             else:
-                self.wifi_label.text = "WiFi?"
-                self.wifi_label.color = 0xFF0000  # Red - disconnected
+                _update_label(self.wifi_label, "WiFi?", 0xFF0000)  # Red - disconnected
         except Exception:
-            self.wifi_label.text = "WiFi?"
-            self.wifi_label.color = 0xFF0000
+            _update_label(self.wifi_label, "WiFi?", 0xFF0000)
             
     def update_ble_status(self):
         """Update BLE status icon"""
         if not BLE_AVAILABLE:
-            self.ble_label.text = ""
+            _update_label(self.ble_label, "")
             return
             
         try:
             # Check if BLE is enabled/active
             if _bleio.adapter.enabled:
                 if _bleio.adapter.connected:
-                    self.ble_label.text = "BLE+"
-                    self.ble_label.color = 0x00FF00  # Green - connected
+                    _update_label(self.ble_label, "BLE+", 0x00FF00)  # Green - connected
                 else:
-                    self.ble_label.text = "BLE"
-                    self.ble_label.color = 0x0080FF  # Blue - advertising/available
+                    _update_label(self.ble_label, "BLE", 0x0080FF)  # Blue - advertising/available
             else:
-                self.ble_label.text = "BLE-"
-                self.ble_label.color = 0x888888  # Gray - disabled
+                _update_label(self.ble_label, "BLE-", 0x888888)  # Gray - disabled
         except Exception:
-            self.ble_label.text = ""
+            _update_label(self.ble_label, "")
             
     def update_time(self):
         """Update time display in 12-hour format"""
@@ -161,6 +204,12 @@ class StatusBar:
             hour = current_time.tm_hour
             minute = current_time.tm_min
             
+            # The label only shows minutes, so skip formatting within the same one
+            time_key = hour * 60 + minute
+            if time_key == self._time_key:
+                return
+            self._time_key = time_key
+            
             # Convert to 12-hour format
             if hour == 0:
                 hour_12 = 12
@@ -181,12 +230,12 @@ class StatusBar:
             # Adjust position based on text width
             self.time_label.x = SCREEN_WIDTH - len(time_str) * 6 - 5
         except Exception:
-            self.time_label.text = "--:-- --"
+            self._time_key = None
+            _update_label(self.time_label, "--:-- --")
             
     def set_status(self, status_text, color=0xFFFFFF):
         """Set the status message"""
-        self.status_label.text = status_text[:20]  # Limit length
-        self.status_label.color = color
+        _update_label(self.status_label, status_text[:20], color)  # Limit length
         
     def update_all(self):
         """Update all status bar elements"""
@@ -201,9 +250,15 @@ class AppLoader:
         self.screen_height = self.display.height
         
         # Initialize button if available
+        self._keys = None
+        self._key_down = False
         try:
-            self.button = digitalio.DigitalInOut(board.BUTTON)
-            self.button.switch_to_input(pull=digitalio.Pull.UP)
+            if KEYPAD_AVAILABLE:
+                # keypad debounces and timestamps edges in the background
+                self._keys = keypad.Keys((board.BUTTON,), value_when_pressed=False, pull=True)
+            else:
+                self.button = digitalio.DigitalInOut(board.BUTTON)
+                self.button.switch_to_input(pull=digitalio.Pull.UP)
             self.has_button = True
         except Exception:
             self.has_button = False
@@ -217,6 +272,10 @@ class AppLoader:
         self.apps_config_path = "/system/apps.json"
         self.apps = []
         self.selected = 0
+        self._last_scan = None
+        self._listing_key = None  # _apps_listing_key() when the apps were scanned
+        self._menu_group = None
+        self._message_group = None
         
         # Load screensaver settings
         self.settings = load_settings()
@@ -224,30 +283,30 @@ class AppLoader:
         self.screensaver_enabled = self.settings.get("SCREENSAVER_ENABLED", True)
         self.screensaver_type = self.settings.get("SCREENSAVER_TYPE", "trippy")  # "trippy" or "constellation"
         
-        # Screensaver timing
-        self.last_activity_time = time.monotonic()
+        # Screensaver timing (supervisor.ticks_ms() values)
+        self.last_activity_ticks = supervisor.ticks_ms()
         self.screensaver_active = False
         
         # Ensure system directory exists
         self._ensure_system_dir()
         
-        # Discover and load apps
-        self._discover_apps()
-        self._load_apps_config()
+        # Discover and load apps, reusing a recent scan after a quick reload
+        if not self._load_cached_scan():
+            self._discover_apps()
+            self._load_apps_config()
+        self._set_display_names()
 
     def _check_screensaver_timeout(self):
         """Check if screensaver should activate"""
         if not self.screensaver_enabled:
             return False
         
-        current_time = time.monotonic()
-        if current_time - self.last_activity_time >= self.screensaver_timeout:
-            return True
-        return False
+        idle_ms = _ticks_diff(supervisor.ticks_ms(), self.last_activity_ticks)
+        return idle_ms >= self.screensaver_timeout * 1000
     
     def _reset_screensaver_timer(self):
         """Reset screensaver timer on user activity"""
-        self.last_activity_time = time.monotonic()
+        self.last_activity_ticks = supervisor.ticks_ms()
     
     def _start_screensaver(self):
         """Start the appropriate screensaver"""
@@ -291,6 +350,20 @@ class AppLoader:
             print(f"Error checking developer mode: {e}")
             return False  # Default to non-developer mode if we can't read NVM
 
+    def _apps_listing_key(self):
+        """Fingerprint the app search paths with one listdir each"""
+        # Much cheaper than a rescan, and changes whenever an app is added or
+        # removed, including over USB while the board was reset or off
+        parts = []
+        for search_path in APP_SEARCH_PATHS:
+            try:
+                names = os.listdir(search_path)
+            except OSError:
+                continue
+            names.sort()
+            parts.append(search_path + ":" + ",".join(names))
+        return "|".join(parts)
+
     
     def _ensure_system_dir(self):
         """Ensure /system directory exists"""
@@ -303,24 +376,15 @@ class AppLoader:
     def _discover_apps(self):
         """Discover apps in /apps directories on flash and SD"""
         discovered_apps = []
+        self._last_scan = time.monotonic()
+        self._listing_key = self._apps_listing_key()
         
-        # Search locations
-        search_paths = ["/apps"]
-        
-        # Check for SD card mount (common mount points)
-        sd_paths = ["/sd/apps", "/mnt/sd/apps", "/external/apps"]
-        for sd_path in sd_paths:
-            try:
-                if os.path.exists(sd_path):
-                    search_paths.append(sd_path)
-            except Exception:
+        # Discover apps in each search location that exists
+        for search_path in APP_SEARCH_PATHS:
+            if not self._file_exists(search_path):
                 continue
-        
-        # Discover apps in each path
-        for search_path in search_paths:
             try:
-                if os.path.exists(search_path):
-                    self._scan_directory_for_apps(search_path, discovered_apps)
+                self._scan_directory_for_apps(search_path, discovered_apps)
             except Exception as e:
                 print(f"Error scanning {search_path}: {e}")
         
@@ -331,7 +395,7 @@ class AppLoader:
                 root_files = os.listdir("/")
                 for filename in root_files:
                     if (filename.endswith(".py") and 
-                        filename not in ("code.py", "boot.py", "app_loader.py") and
+                        filename not in ROOT_SYSTEM_FILES and
                         not filename.startswith(".")):
                         
                         app_info = {
@@ -352,9 +416,14 @@ class AppLoader:
     def _scan_directory_for_apps(self, directory, apps_list):
         """Scan a directory for Python apps"""
         try:
-            items = os.listdir(directory)
-            for item in items:
-                item_path = directory + "/" + item
+            if _ilistdir is not None:
+                # Types come with the listing, so plain files need no probe
+                items = [(entry[0], bool(entry[1] & 0x4000)) for entry in _ilistdir(directory)]
+            else:
+                items = [(item, None) for item in os.listdir(directory)]
+            prefix = directory if directory.endswith("/") else directory + "/"
+            for item, is_dir in items:
+                item_path = prefix + item
                 
                 if item.endswith(".py"):
                     # Single Python file app
@@ -367,12 +436,18 @@ class AppLoader:
                     }
                     apps_list.append(app_info)
                     
-                elif self._is_directory(item_path):
-                    # Directory-based app (look for main.py or app.py)
+                elif is_dir is not False:
+                    # Directory-based app (look for main.py or app.py). One
+                    # listdir answers both "is it a directory" and which entry
+                    # file it has, instead of a stat per candidate
+                    try:
+                        contents = os.listdir(item_path)
+                    except OSError:
+                        continue  # Plain file, not an app directory
                     main_files = ["main.py", "app.py", item + ".py"]
                     for main_file in main_files:
                         main_path = item_path + "/" + main_file
-                        if self._file_exists(main_path):
+                        if main_file in contents:
                             app_info = {
                                 "name": item,
                                 "path": main_path,
@@ -402,6 +477,39 @@ class AppLoader:
         except Exception:
             return False
 
+    def _load_cached_scan(self):
+        """Use the saved apps list if it was scanned within APPS_SCAN_TTL"""
+        # Developer mode edits files between reloads, so always rescan there
+        if self._is_developer_mode():
+            return False
+        try:
+            with open(self.apps_config_path, "r") as f:
+                config = json.load(f)
+            last_scan = config.get("last_scan")
+            if last_scan is None:
+                return False
+            # monotonic() restarts on hard reset, so the age alone can't tell
+            # a fresh scan from one saved before a reset; the listing must match
+            listing_key = self._apps_listing_key()
+            if config.get("listing_key") != listing_key:
+                return False
+            age = time.monotonic() - last_scan
+            if not 0 <= age < APPS_SCAN_TTL:
+                return False
+            # Drop apps deleted since the scan, as _load_apps_config does
+            self.apps = [app for app in config.get("apps", []) if self._file_exists(app["path"])]
+            self._last_scan = last_scan
+            self._listing_key = listing_key
+            return True
+        except Exception:
+            return False
+
+    def _set_display_names(self):
+        """Truncate each app name for the menu once, not on every redraw"""
+        for app in self.apps:
+            name = app["name"]
+            app["display_name"] = name[:22] + "..." if len(name) > 25 else name
+
     def _load_apps_config(self):
         """Load apps configuration from JSON file"""
         try:
@@ -412,15 +520,19 @@ class AppLoader:
             # Merge discovered apps with saved configuration
             self.apps = []
             
+            known_paths = set()
+            
             # First, add apps from config that still exist
             for saved_app in saved_apps:
                 if self._file_exists(saved_app["path"]):
                     self.apps.append(saved_app)
+                    known_paths.add(saved_app["path"])
             
             # Then add newly discovered apps not in config
             for discovered_app in self.discovered_apps:
-                if not any(app["path"] == discovered_app["path"] for app in self.apps):
+                if discovered_app["path"] not in known_paths:
                     self.apps.append(discovered_app)
+                    known_paths.add(discovered_app["path"])
             
             # Save updated configuration
             self._save_apps_config()
@@ -434,25 +546,23 @@ class AppLoader:
     def _save_apps_config(self):
         """Save apps configuration to JSON file"""
         try:
+            # display_name is a menu-only truncation; keep it out of the file
             config = {
-                "apps": self.apps,
-                "last_updated": time.time()
+                "apps": [
+                    {key: value for key, value in app.items() if key != "display_name"}
+                    for app in self.apps
+                ],
+                "last_updated": time.time(),
+                "last_scan": self._last_scan,
+                "listing_key": self._listing_key
             }
             with open(self.apps_config_path, "w") as f:
                 json.dump(config, f)
         except Exception as e:
             print(f"Error saving apps config: {e}")
 
-    def draw_menu(self):
-        """Draw the main menu with status bar"""
-        # Clear main group but keep status bar
-        while len(self.main_group) > 1:
-            self.main_group.pop()
-        
-        # Update status bar
-        self.status_bar.update_all()
-        
-        # Create menu group
+    def _build_menu_group(self):
+        """Create the main menu widgets once so redraws only update them"""
         menu_group = displayio.Group()
         
         # Title
@@ -464,20 +574,66 @@ class AppLoader:
             y=MENU_START_Y + 10
         )
         menu_group.append(title)
+        
+        # One label per visible row, reused for whichever app scrolls into it
+        menu_height = self.screen_height - MENU_START_Y - 40
+        self._menu_max_visible = menu_height // 15
+        self._menu_labels = []
+        for row in range(self._menu_max_visible):
+            app_label = label.Label(
+                terminalio.FONT,
+                text="",
+                color=0xFFFFFF,
+                x=10,
+                y=MENU_START_Y + 30 + row * 15
+            )
+            self._menu_labels.append(app_label)
+            menu_group.append(app_label)
+        
+        # Navigation help
+        self._menu_help_label = label.Label(
+            terminalio.FONT,
+            text="",
+            color=0x888888,
+            x=10,
+            y=self.screen_height - 30
+        )
+        menu_group.append(self._menu_help_label)
+        
+        # Position indicator
+        self._menu_pos_label = label.Label(
+            terminalio.FONT,
+            text="",
+            color=0x888888,
+            x=self.screen_width - 60,
+            y=self.screen_height - 30
+        )
+        menu_group.append(self._menu_pos_label)
+        
+        self._menu_group = menu_group
 
+    def draw_menu(self):
+        """Draw the main menu with status bar"""
+        if self._menu_group is None:
+            self._build_menu_group()
+        
+        # Clear main group but keep status bar (and the menu if already shown)
+        while len(self.main_group) > 1 and self.main_group[-1] is not self._menu_group:
+            self.main_group.pop()
+        
+        # Update status bar
+        self.status_bar.update_all()
+        
+        labels = self._menu_labels
         if not self.apps:
-            no_apps_label = label.Label(
-                terminalio.FONT, 
-                text="No apps found.", 
-                color=0xFF0000, 
-                x=10, 
-                y=MENU_START_Y + 30
-            )
-            menu_group.append(no_apps_label)
+            _update_label(labels[0], "No apps found.", 0xFF0000)
+            for app_label in labels[1:]:
+                _update_label(app_label, "")
+            _update_label(self._menu_help_label, "")
+            _update_label(self._menu_pos_label, "")
         else:
             # Calculate visible apps
-            menu_height = self.screen_height - MENU_START_Y - 40
-            max_visible = menu_height // 15
+            max_visible = self._menu_max_visible
             start_idx = max(0, self.selected - max_visible // 2)
             end_idx = min(len(self.apps), start_idx + max_visible)
             
@@ -487,77 +643,66 @@ class AppLoader:
             # Display apps
             enabled_apps = [app for app in self.apps if app.get("enabled", True)]
             
-            for i in range(start_idx, end_idx):
-                if i < len(enabled_apps):
+            for row, app_label in enumerate(labels):
+                i = start_idx + row
+                if i < end_idx and i < len(enabled_apps):
                     app = enabled_apps[i]
                     prefix = ">" if i == self.selected else " "
                     color = 0x00FF00 if i == self.selected else 0xFFFFFF
                     
-                    # Truncate long names
-                    display_name = app["name"]
-                    if len(display_name) > 25:
-                        display_name = display_name[:22] + "..."
-                    
-                    app_label = label.Label(
-                        terminalio.FONT,
-                        text=f"{prefix} {display_name}",
-                        color=color,
-                        x=10,
-                        y=MENU_START_Y + 30 + (i - start_idx) * 15
-                    )
-                    menu_group.append(app_label)
-            
-            # Navigation help
-            help_text = "Short: Next  Long: Run  Hold: Menu"
-            help_label = label.Label(
-                terminalio.FONT,
-                text=help_text,
-                color=0x888888,
-                x=10,
-                y=self.screen_height - 30
-            )
-            menu_group.append(help_label)
+                    display_name = app.get("display_name", app["name"])
+                    _update_label(app_label, f"{prefix} {display_name}", color)
+                else:
+                    _update_label(app_label, "")
             
-            # Position indicator
-            pos_text = f"{self.selected+1}/{len(enabled_apps)}"
-            pos_label = label.Label
-            pos_label = label.Label(
-                terminalio.FONT,
-                text=pos_text,
-                color=0x888888,
-                x=self.screen_width - 60,
-                y=self.screen_height - 30
-            )
-            menu_group.append(pos_label)
+            _update_label(self._menu_help_label, "Short: Next  Long: Run  Hold: Menu")
+            _update_label(self._menu_pos_label, f"{self.selected+1}/{len(enabled_apps)}")
 
-        self.main_group.append(menu_group)
-        self.display.root_group = self.main_group
+        if len(self.main_group) == 1:
+            self.main_group.append(self._menu_group)
+        if self.display.root_group is not self.main_group:
+            self.display.root_group = self.main_group
+
+    def _build_message_group(self):
+        """Create one reusable label per message line that fits on screen"""
+        message_group = displayio.Group()
+        self._message_labels = []
+        for i in range((self.screen_height - MENU_START_Y - 20) // 20 + 1):
+            text_label = label.Label(
+                terminalio.FONT, 
+                text="", 
+                color=0xFFFFFF, 
+                x=10, 
+                y=MENU_START_Y + 20 + i * 20
+            )
+            self._message_labels.append(text_label)
+            message_group.append(text_label)
+        self._message_group = message_group
 
     def show_message(self, msg, color=0xFFFFFF, duration=None):
         """Show a message on screen"""
-        # Clear main group but keep status bar
-        while len(self.main_group) > 1:
+        if self._message_group is None:
+            self._build_message_group()
+        
+        # Clear main group but keep status bar (and the message if already shown)
+        while len(self.main_group) > 1 and self.main_group[-1] is not self._message_group:
             self.main_group.pop()
         
         # Update status bar
         self.status_bar.update_all()
         
-        message_group = displayio.Group()
         lines = msg.split("\n")
+        for i, text_label in enumerate(self._message_labels):
+            line = lines[i] if i < len(lines) else ""
+            if line.strip():
+                _update_label(text_label, line, color)
+            else:
+                _update_label(text_label, "")  # Empty lines keep their slot
         
-        for i, line in enumerate(lines):
-            if line.strip():  # Skip empty lines
-                text_label = label.Label(
-                    terminalio.FONT, 
-                    text=line, 
-                    color=color, 
-                    x=10, 
-                    y=MENU_START_Y + 20 + i * 20
-                )
-                message_group.append(text_label)
-        
-        self.main_group.append(message_group)
-        self.display.root_group = self.main_group
+        if len(self.main_group) == 1:
+            self.main_group.append(self._message_group)
+        if self.display.root_group is not self.main_group:
+            self.display.root_group = self.main_group
         
         if duration:
             time.sleep(duration)
@@ -676,190 +821,153 @@ class AppLoader:
         
         self._discover_apps()
         self._load_apps_config()
+        self._set_display_names()
         self.selected = 0
         
         self.status_bar.set_status("Apps refreshed", 0x00FF00)
         time.sleep(1)
         self.status_bar.set_status("Ready", 0xFFFFFF)
 
-    def show_settings_menu(self):
-        """Show settings/management menu"""
-        settings_options = [
-            "Refresh Apps",
-            "Toggle App Status",
-            "View App Details", 
-            "Screensaver Settings",
-            "System Info",
-            "Back to Main Menu"
-        ]
+    def _show_screen(self, title, rows, help_text=None):
+        """Show a titled list of (text, color) rows below the status bar"""
+        # Clear main group but keep status bar
+        while len(self.main_group) > 1:
+            self.main_group.pop()
         
-        settings_selected = 0
+        self.status_bar.update_all()
         
-        while True:
-            # Clear main group but keep status bar
-            while len(self.main_group) > 1:
-                self.main_group.pop()
-            
-            self.status_bar.update_all()
-            
-            settings_group = displayio.Group()
-            
-            # Title
-            title = label.Label(
+        screen_group = displayio.Group()
+        screen_group.append(label.Label(
+            terminalio.FONT,
+            text=title,
+            color=0xFF8000,
+            x=10,
+            y=MENU_START_Y + 10
+        ))
+        
+        for i, (text, color) in enumerate(rows):
+            screen_group.append(label.Label(
                 terminalio.FONT,
-                text="Settings",
-                color=0xFF8000,
+                text=text,
+                color=color,
                 x=10,
-                y=MENU_START_Y + 10
-            )
-            settings_group.append(title)
-            
-            # Options
-            for i, option in enumerate(settings_options):
-                prefix = ">" if i == settings_selected else " "
-                color = 0x00FF00 if i == settings_selected else 0xFFFFFF
-                
-                option_label = label.Label(
-                    terminalio.FONT,
-                    text=f"{prefix} {option}",
-                    color=color,
-                    x=10,
-                    y=MENU_START_Y + 30 + i * 15
-                )
-                settings_group.append(option_label)
-            
-            self.main_group.append(settings_group)
-            self.display.root_group = self.main_group
+                y=MENU_START_Y + 30 + i * 15
+            ))
+        
+        if help_text:
+            screen_group.append(label.Label(
+                terminalio.FONT,
+                text=help_text,
+                color=0x888888,
+                x=10,
+                y=self.screen_height - 20
+            ))
+        
+        self.main_group.append(screen_group)
+        self.display.root_group = self.main_group
+
+    def _option_rows(self, options, selected):
+        """Build (text, color) rows for a menu with one highlighted option"""
+        return [
+            (f"{'>' if i == selected else ' '} {option}", 0x00FF00 if i == selected else 0xFFFFFF)
+            for i, option in enumerate(options)
+        ]
+
+    def _run_menu_loop(self, title, get_options, on_select, help_text=None):
+        """Run a short-press-next / long-press-select menu until on_select returns True"""
+        selected = 0
+        
+        while True:
+            options = get_options()
+            self._show_screen(title, self._option_rows(options, selected), help_text)
             
             # Handle input
             press_duration = self._handle_button_input()
             
             if press_duration > 1.0:  # Long press - select option
-                if settings_selected == 0:  # Refresh Apps
-                    self.refresh_apps()
-                elif settings_selected == 1:  # Toggle App Status
-                    self._toggle_app_status()
-                elif settings_selected == 2:  # View App Details
-                    self._view_app_details_menu()
-                elif settings_selected == 3:  # Screensaver Settings
-                    self._show_screensaver_settings()
-                elif settings_selected == 4:  # System Info
-                    self._show_system_info()
-                elif settings_selected == 5:  # Back
+                if on_select(selected):
                     break
-                    
             elif press_duration > 0.05:  # Short press - navigate
-                settings_selected = (settings_selected + 1) % len(settings_options)
+                selected = (selected + 1) % len(options)
             
             # Reset screensaver timer on any activity
             self._reset_screensaver_timer()
 
+    def show_settings_menu(self):
+        """Show settings/management menu"""
+        settings_options = (
+            "Refresh Apps",
+            "Toggle App Status",
+            "View App Details", 
+            "Screensaver Settings",
+            "System Info",
+            "Back to Main Menu"
+        )
+        # Handlers in option order; the last option (Back) has none
+        settings_actions = (
+            self.refresh_apps,
+            self._toggle_app_status,
+            self._view_app_details_menu,
+            self._show_screensaver_settings,
+            self._show_system_info,
+        )
+        
+        def on_select(index):
+            if index >= len(settings_actions):  # Back
+                return True
+            settings_actions[index]()
+            return False
+        
+        self._run_menu_loop("Settings", lambda: settings_options, on_select)
 
     def _show_screensaver_settings(self):
         """Show screensaver configuration"""
-        screensaver_options = [
-            f"Enabled: {'Yes' if self.screensaver_enabled else 'No'}",
-            f"Timeout: {self.screensaver_timeout//60}min {self.screensaver_timeout%60}s",
-            f"Type: {self.screensaver_type.title()}",
-            "Test Screensaver",
-            "Back"
-        ]
-        
-        screensaver_selected = 0
-        
-        while True:
-            # Clear main group but keep status bar
-            while len(self.main_group) > 1:
-                self.main_group.pop()
-            
-            self.status_bar.update_all()
-            
-            screensaver_group = displayio.Group()
-            
-            # Title
-            title = label.Label(
-                terminalio.FONT,
-                text="Screensaver Settings",
-                color=0xFF8000,
-                x=10,
-                y=MENU_START_Y + 10
+        def get_options():
+            # Rebuilt each pass so the values reflect the last change
+            return (
+                f"Enabled: {'Yes' if self.screensaver_enabled else 'No'}",
+                f"Timeout: {self.screensaver_timeout//60}min {self.screensaver_timeout%60}s",
+                f"Type: {self.screensaver_type.title()}",
+                "Test Screensaver",
+                "Back"
             )
-            screensaver_group.append(title)
-            
-            # Update options with current values
-            screensaver_options[0] = f"Enabled: {'Yes' if self.screensaver_enabled else 'No'}"
-            screensaver_options[1] = f"Timeout: {self.screensaver_timeout//60}min {self.screensaver_timeout%60}s"
-            screensaver_options[2] = f"Type: {self.screensaver_type.title()}"
-            
-            # Options
-            for i, option in enumerate(screensaver_options):
-                prefix = ">" if i == screensaver_selected else " "
-                color = 0x00FF00 if i == screensaver_selected else 0xFFFFFF
+        
+        def on_select(index):
+            if index == 0:  # Toggle enabled
+                self.screensaver_enabled = not self.screensaver_enabled
+                self.settings["SCREENSAVER_ENABLED"] = self.screensaver_enabled
+                save_settings(self.settings)
                 
-                option_label = label.Label(
-                    terminalio.FONT,
-                    text=f"{prefix} {option}",
-                    color=color,
-                    x=10,
-                    y=MENU_START_Y + 30 + i * 15
-                )
-                screensaver_group.append(option_label)
-            
-            # Help text
-            help_label = label.Label(
-                terminalio.FONT,
-                text="Long: Select  Short: Next",
-                color=0x888888,
-                x=10,
-                y=self.screen_height - 20
-            )
-            screensaver_group.append(help_label)
-            
-            self.main_group.append(screensaver_group)
-            self.display.root_group = self.main_group
-            
-            # Handle input
-            press_duration = self._handle_button_input()
-            
-            if press_duration > 1.0:  # Long press - select option
-                if screensaver_selected == 0:  # Toggle enabled
-                    self.screensaver_enabled = not self.screensaver_enabled
-                    self.settings["SCREENSAVER_ENABLED"] = self.screensaver_enabled
-                    save_settings(self.settings)
-                    
-                elif screensaver_selected == 1:  # Change timeout
-                    timeouts = [60, 120, 300, 600, 900, 1800]  # 1min, 2min, 5min, 10min, 15min, 30min
-                    current_index = 0
-                    for i, timeout in enumerate(timeouts):
-                        if timeout >= self.screensaver_timeout:
-                            current_index = i
-                            break
-                    
-                    next_index = (current_index + 1) % len(timeouts)
-                    self.screensaver_timeout = timeouts[next_index]
-                    self.settings["SCREENSAVER_TIMEOUT"] = self.screensaver_timeout
-                    save_settings(self.settings)
-                    
-                elif screensaver_selected == 2:  # Change type
-                    types = ["trippy", "constellation"]
-                    current_index = types.index(self.screensaver_type) if self.screensaver_type in types else 0
-                    next_index = (current_index + 1) % len(types)
-                    self.screensaver_type = types[next_index]
-                    self.settings["SCREENSAVER_TYPE"] = self.screensaver_type
-                    save_settings(self.settings)
-                    
-                elif screensaver_selected == 3:  # Test screensaver
-                    self.show_message("Starting screensaver test...", color=0x00FFFF, duration=1)
-                    self._start_screensaver()
-                    
-                elif screensaver_selected == 4:  # Back
-                    break
-                    
-            elif press_duration > 0.05:  # Short press - navigate
-                screensaver_selected = (screensaver_selected + 1) % len(screensaver_options)
-            
-            # Reset screensaver timer on any activity
-            self._reset_screensaver_timer()
+            elif index == 1:  # Change timeout
+                timeouts = [60, 120, 300, 600, 900, 1800]  # 1min, 2min, 5min, 10min, 15min, 30min
+                current_index = 0
+                for i, timeout in enumerate(timeouts):
+                    if timeout >= self.screensaver_timeout:
+                        current_index = i
+                        break
+                
+                next_index = (current_index + 1) % len(timeouts)
+                self.screensaver_timeout = timeouts[next_index]
+                self.settings["SCREENSAVER_TIMEOUT"] = self.screensaver_timeout
+                save_settings(self.settings)
+                
+            elif index == 2:  # Change type
+                types = ["trippy", "constellation"]
+                current_index = types.index(self.screensaver_type) if self.screensaver_type in types else 0
+                next_index = (current_index + 1) % len(types)
+                self.screensaver_type = types[next_index]
+                self.settings["SCREENSAVER_TYPE"] = self.screensaver_type
+                save_settings(self.settings)
+                
+            elif index == 3:  # Test screensaver
+                self.show_message("Starting screensaver test...", color=0x00FFFF, duration=1)
+                self._start_screensaver()
+                
+            elif index == 4:  # Back
+                return True
+            return False
+        
+        self._run_menu_loop("Screensaver Settings", get_options, on_select, "Long: Select  Short: Next")
 
 
 
@@ -873,47 +981,14 @@ class AppLoader:
         
         while True:
             # Show app list with status
-            while len(self.main_group) > 1:
-                self.main_group.pop()
-            
-            self.status_bar.update_all()
-            toggle_group = displayio.Group()
-            
-            title = label.Label(
-                terminalio.FONT,
-                text="Toggle App Status",
-                color=0xFF8000,
-                x=10,
-                y=MENU_START_Y + 10
-            )
-            toggle_group.append(title)
-            
+            rows = []
             for i, app in enumerate(self.apps[:10]):  # Show first 10 apps
                 prefix = ">" if i == app_selected else " "
                 status = "ON" if app.get("enabled", True) else "OFF"
                 color = 0x00FF00 if i == app_selected else (0xFFFFFF if app.get("enabled", True) else 0x888888)
-                
-                text = f"{prefix} {app['name'][:15]} [{status}]"
-                app_label = label.Label(
-                    terminalio.FONT,
-                    text=text,
-                    color=color,
-                    x=10,
-                    y=MENU_START_Y + 30 + i * 15
-                )
-                toggle_group.append(app_label)
+                rows.append((f"{prefix} {app['name'][:15]} [{status}]", color))
             
-            help_label = label.Label(
-                terminalio.FONT,
-                text="Long: Toggle  Short: Next  Hold: Exit",
-                color=0x888888,
-                x=10,
-                y=self.screen_height - 20
-            )
-            toggle_group.append(help_label)
-            
-            self.main_group.append(toggle_group)
-            self.display.root_group = self.main_group
+            self._show_screen("Toggle App Status", rows, "Long: Toggle  Short: Next  Hold: Exit")
             
             press_duration = self._handle_button_input()
             
@@ -955,7 +1030,7 @@ class AppLoader:
             gc.collect()
             free_mem = gc.mem_free()
             total_apps = len(self.apps)
-            enabled_apps = len([app for app in self.apps if app.get("enabled", True)])
+            enabled_apps = sum(1 for app in self.apps if app.get("enabled", True))
             
             info = f"System Information\n\n"
             info += f"Free Memory: {free_mem} bytes\n"
@@ -973,28 +1048,31 @@ class AppLoader:
             self.show_message(f"Error getting system info:\n{str(e)}", color=0xFF0000)
             time.sleep(2)
 
-    def _handle_button_input(self):
-        """Handle button input and return press duration"""
-        if not self.has_button:
-            time.sleep(0.1)
-            return 0
-            
-        # Wait for button press
-        while self.button.value:
-            time.sleep(0.01)
-        
-        # Measure press duration
-        press_start = time.monotonic()
-        while not self.button.value:
-            time.sleep(0.01)
-        
-        return time.monotonic() - press_start
+    def _read_key_event(self):
+        """Return the next queued button event (or None), tracking held state"""
+        event = self._keys.events.get()
+        if event is not None:
+            self._key_down = event.pressed
+        return event
+
+    def _wait_for_key(self, pressed):
+        """Block until the button is pressed (or released); return the event timestamp"""
+        while True:
+            event = self._read_key_event()
+            if event is None:
+                time.sleep(0.02)
+            elif event.pressed == pressed:
+                return event.timestamp
 
     def _wait_for_button_press(self):
         """Wait for button press"""
         if not self.has_button:
             time.sleep(1)
             return
+        
+        if self._keys is not None:
+            self._wait_for_key(True)
+            return
             
         while self.button.value:
             time.sleep(0.01)
@@ -1003,6 +1081,14 @@ class AppLoader:
         """Wait for button release"""
         if not self.has_button:
             return
+        
+        if self._keys is not None:
+            # Catch up on queued edges so _key_down reflects the button now
+            while self._read_key_event() is not None:
+                pass
+            if self._key_down:
+                self._wait_for_key(False)
+            return
             
         while not self.button.value:
             time.sleep(0.01)
@@ -1012,7 +1098,7 @@ class AppLoader:
         self.status_bar.set_status("Ready")
         self.draw_menu()
         
-        last_status_update = time.monotonic()
+        last_status_update = supervisor.ticks_ms()
         
         while True:
             try:
@@ -1027,9 +1113,10 @@ class AppLoader:
                     continue
                 
                 # Update status bar periodically
-                if time.monotonic() - last_status_update > 5:
+                now = supervisor.ticks_ms()
+                if _ticks_diff(now, last_status_update) > 5000:
                     self.status_bar.update_all()
-                    last_status_update = time.monotonic()
+                    last_status_update = now
                 
                 if self.has_button:
                     press_duration = self._handle_button_input()
@@ -1069,6 +1156,12 @@ class AppLoader:
         if not self.has_button:
             time.sleep(0.1)
             return 0
+        
+        if self._keys is not None:
+            press_ts = self._wait_for_key(True)
+            self._reset_screensaver_timer()
+            # Event timestamps are supervisor.ticks_ms() values
+            return _ticks_diff(self._wait_for_key(False), press_ts) / 1000
             
         # Wait for button press
         while self.button.value:
@@ -1078,11 +1171,11 @@ class AppLoader:
         self._reset_screensaver_timer()
         
         # Measure press duration
-        press_start = time.monotonic()
+        press_start = supervisor.ticks_ms()
         while not self.button.value:
             time.sleep(0.01)
         
-        return time.monotonic() - press_start
+        return _ticks_diff(supervisor.ticks_ms(), press_start) / 1000
 
 
 def main():
@@ -64,6 +64,7 @@ BOOT_LOOP_THRESHOLD_ADDR = 5
 LAST_SUCCESSFUL_BOOT_ADDR = 6
 USB_HOST_ADDR = 7
 FIRST_BOOT_SETUP_FLAG_ADDR = 8
+LAST_BOOT_FILE_ADDR = 9  # Index in the boot priority list of the last file selected
 
 # Reset type constants
 RESET_POWER_ON = 1
@@ -81,7 +82,18 @@ DEFAULT_BOOT_FILE = "app_loader.py"
 DEFAULT_TIMEOUT = 3
 
 # Boot file priority order
-BOOT_FILES = ["app_loader.py", "main.py", "code.py", "user_app.py"]
+BOOT_FILES = ("app_loader.py", "main.py", "code.py", "user_app.py")
+
+# Splash images tried in order, and directories created on a fresh SD card
+SPLASH_FILES = ("stagetwo_boot.bmp", "boot_splash.bmp", "splash.bmp")
+SD_ESSENTIAL_DIRS = ("apps", "backups", "config", "data", "logs")
+# Written once the SD directories exist; a version bump re-provisions the card
+SD_PROVISIONED_MARKER = "/sd/.stagetwo_provisioned"
+
+# Settings parsed as booleans; built once instead of per settings line
+_BOOL_SETTINGS = {"DEVELOPER_MODE", "FLASH_WRITE", "SD_CARD_ENABLED",
+                  "WIFI_ENABLED", "NTP_ENABLED", "SCREENSAVER_ENABLED"}
+_TRUE_VALUES = ("true", "1", "yes", "on")
 
 # SD Card pin configuration (adjust for your board)
 try:
@@ -103,6 +115,16 @@ except AttributeError:
         SD_PINS_AVAILABLE = False
         print("No SD pins available")
 
+# Capability lines for the boot log (flags are fixed once imported)
+_SD_STATUS_LINE = "SD Card: " + ("Available" if SDCARD_AVAILABLE and SD_PINS_AVAILABLE else "Not Available") + "\n"
+_WIFI_STATUS_LINE = "WiFi/NTP: " + ("Available" if NTP_AVAILABLE else "Not Available") + "\n"
+
+# Monotonic deadline before the splash may be replaced (0 = no splash pending)
+_splash_until = 0
+
+# gc.mem_free() walks the heap; main() takes one reading at the end of boot
+_boot_mem_free = None
+
 # --- Settings Management ---
 def read_settings():
     """Read settings from settings.toml with comprehensive error handling"""
@@ -124,7 +146,7 @@ def read_settings():
         with open(SETTINGS_PATH, "r") as f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
-                if not line or line.startswith("#"):
+                if not line or line[0] == "#":
                     continue
                 
                 if "=" not in line:
@@ -136,15 +158,14 @@ def read_settings():
                     value = value.strip().strip('"').strip("'")
                     
                     # Type conversion
-                    if key in ["BOOT_TIMEOUT"]:
+                    if key in _BOOL_SETTINGS:
+                        settings[key] = value.lower() in _TRUE_VALUES
+                    elif key == "BOOT_TIMEOUT":
                         settings[key] = int(value)
-                    elif key in ["DEVELOPER_MODE", "FLASH_WRITE", "SD_CARD_ENABLED", 
-                               "WIFI_ENABLED", "NTP_ENABLED", "SCREENSAVER_ENABLED"]:
-                        settings[key] = value.lower() in ("true", "1", "yes", "on")
-                    elif key in ["DISPLAY_BRIGHTNESS"]:
+                    elif key == "DISPLAY_BRIGHTNESS":
                         brightness = float(value)
                         settings[key] = max(0.1, min(1.0, brightness))  # Clamp between 10% and 100%
-                    elif key in ["SCREENSAVER_TIMEOUT"]:
+                    elif key == "SCREENSAVER_TIMEOUT":
                         settings[key] = max(60, int(value))  # Minimum 1 minute
                     else:
                         settings[key] = value
@@ -231,7 +252,10 @@ settings = read_settings()
 def set_nvm_flag(address, value):
     """Set NVM flag with error handling"""
     try:
-        microcontroller.nvm[address] = 1 if value else 0
+        # Skip unchanged bytes: each NVM write can cost a flash page erase
+        byte = 1 if value else 0
+        if microcontroller.nvm[address] != byte:
+            microcontroller.nvm[address] = byte
         return True
     except (IndexError, OSError) as e:
         print(f"NVM write error at {address}: {e}")
@@ -254,7 +278,9 @@ def read_nvm_byte(address):
 def write_nvm_byte(address, value):
     """Write NVM byte with error handling"""
     try:
-        microcontroller.nvm[address] = min(255, max(0, int(value)))
+        byte = min(255, max(0, int(value)))
+        if microcontroller.nvm[address] != byte:
+            microcontroller.nvm[address] = byte
         return True
     except (IndexError, OSError, ValueError) as e:
         print(f"NVM byte write error at {address}: {e}")
@@ -352,20 +378,42 @@ def prepare_sdcard():
         # Mount SD card
         storage.mount(vfs, '/sd')
         
+        # A card already provisioned by this version needs no listing or mkdirs;
+        # reading the marker also proves the card is accessible
+        try:
+            with open(SD_PROVISIONED_MARKER, "r") as f:
+                if f.read().strip() == __version__:
+                    print("SD card mounted successfully")
+                    return True
+        except OSError:
+            pass
+        
         # Test SD card access
         try:
             files = os.listdir('/sd')
             print(f"SD card mounted successfully - {len(files)} items found")
             
-            # Create essential directories
-            essential_dirs = ['apps', 'backups', 'config', 'data', 'logs']
-            for dir_name in essential_dirs:
+            # Create essential directories missing from the listing above
+            all_present = True
+            for dir_name in SD_ESSENTIAL_DIRS:
+                if dir_name in files:
+                    continue
                 dir_path = f'/sd/{dir_name}'
                 try:
                     os.mkdir(dir_path)
                     print(f"Created directory: {dir_path}")
-                except OSError:
-                    pass  # Directory already exists
+                except OSError as e:
+                    if e.errno != 17:  # EEXIST is fine; anything else retries next boot
+                        all_present = False
+                        print(f"Could not create {dir_path}: {e}")
+            
+            # Only mark the card once every directory is in place
+            if all_present:
+                try:
+                    with open(SD_PROVISIONED_MARKER, "w") as f:
+                        f.write(__version__)
+                except OSError as e:
+                    print(f"SD provisioning marker not written: {e}")
             
             return True
             
@@ -427,6 +475,20 @@ def set_time_if_wifi():
         return False
 
 # --- Boot Splash and UI ---
+def _hold_splash(seconds):
+    """Keep the splash up for seconds while boot work continues"""
+    global _splash_until
+    _splash_until = time.monotonic() + seconds
+
+def _wait_for_splash():
+    """Sleep only for whatever is left of the splash display time"""
+    global _splash_until
+    if _splash_until:
+        remaining = _splash_until - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        _splash_until = 0
+
 def show_splash():
     """Show boot splash with fallback options"""
     if not IMAGE_AVAILABLE:
@@ -437,9 +499,7 @@ def show_splash():
         display = board.DISPLAY
         
         # Try to load custom splash
-        splash_files = ["stagetwo_boot.bmp", "boot_splash.bmp", "splash.bmp"]
-        
-        for splash_file in splash_files:
+        for splash_file in SPLASH_FILES:
             try:
                 image, palette = adafruit_imageload.load(
                     splash_file, bitmap=displayio.Bitmap, palette=displayio.Palette
@@ -451,10 +511,7 @@ def show_splash():
                 
                 display.root_group = group
                 print(f"Splash loaded: {splash_file}")
-                time.sleep
-                display.root_group = group
-                print(f"Splash loaded: {splash_file}")
-                time.sleep(2)
+                _hold_splash(2)
                 return
                 
             except Exception as e:
@@ -517,12 +574,12 @@ def show_text_splash():
         splash_group.append(status_label)
         
         display.root_group = splash_group
-        time.sleep(1.5)
+        _hold_splash(1.5)
         
     except Exception as e:
         print(f"Text splash error: {e}")
 
-def show_boot_status(message, color=0xFFFFFF):
+def show_boot_status(message, color=0xFFFFFF, hold=0.5):
     """Show boot status message"""
     try:
         display = board.DISPLAY
@@ -551,8 +608,10 @@ def show_boot_status(message, color=0xFFFFFF):
                 )
                 status_group.append(status_label)
         
+        _wait_for_splash()
         display.root_group = status_group
-        time.sleep(0.5)
+        if hold:
+            time.sleep(hold)
         
     except Exception as e:
         print(f"Boot status display error: {e}")
@@ -659,12 +718,22 @@ def find_boot_file():
             if file not in priority_files:
                 priority_files.append(file)
         
+        # Check the preferred file first, then the fallback that worked last
+        # time, so a missing preferred file doesn't cost a stat per fallback
+        order = list(range(len(priority_files)))
+        last_index = read_nvm_byte(LAST_BOOT_FILE_ADDR)
+        if 0 < last_index < len(order):
+            order.remove(last_index)
+            order.insert(1, last_index)
+        
         # Check each file in priority order
-        for boot_file in priority_files:
+        for index in order:
+            boot_file = priority_files[index]
             try:
                 stat_result = os.stat(boot_file)
                 if stat_result[6] > 0:  # File size > 0
                     print(f"Boot file selected: {boot_file}")
+                    write_nvm_byte(LAST_BOOT_FILE_ADDR, index)
                     return boot_file
             except OSError:
                 continue
@@ -732,6 +801,7 @@ Enjoy your StageTwo experience!
 # --- Main Boot Logic ---
 def main():
     """Main boot sequence with comprehensive error handling"""
+    global _boot_mem_free
     print("=" * 50)
     print(f"🚀 StageTwo Boot System v{__version__}")
     print("=" * 50)
@@ -748,7 +818,6 @@ def main():
         # Analyze reset cause
         reset_type, reset_description = analyze_reset_cause()
         show_boot_status(f"Boot Analysis\n\n{reset_description}\nInitializing...", 0x00FFFF)
-        prepare_sdcard()
         
         # Check for first boot
         is_first_boot = check_first_boot()
@@ -797,10 +866,6 @@ def main():
         else:
             print("⚠️ Time synchronization skipped")
         
-        # Memory cleanup before app launch
-        gc.collect()
-        print(f"💾 Pre-launch memory: {gc.mem_free()} bytes free")
-        
         # Determine what to boot
         if recovery_mode:
             print("🔧 Booting into recovery mode")
@@ -835,8 +900,9 @@ def main():
                     print("✅ Boot file set successfully")
                 except Exception as e:
                     print(f"❌ Boot file setup failed: {e}")
-                    # Try direct execution as fallback
+                    # Try direct execution as fallback (runs in this VM, so free memory first)
                     try:
+                        gc.collect()
                         exec(open(boot_file).read())
                     except Exception as exec_error:
                         print(f"❌ Direct execution failed: {exec_error}")
@@ -884,10 +950,10 @@ def main():
         return False
     
     finally:
-        # Final cleanup
-        gc.collect()
+        # No gc.collect() here: the VM heap is discarded once boot.py returns
         try:
-            print(f"💾 Boot complete - {gc.mem_free()} bytes free")
+            _boot_mem_free = gc.mem_free()
+            print(f"💾 Boot complete - {_boot_mem_free} bytes free")
         except Exception:
             pass
 
@@ -917,15 +983,15 @@ def emergency_reset():
     try:
         print("🚨 Emergency reset initiated")
         
-        # Clear all NVM flags
-        for i in range(10):
-            try:
-                microcontroller.nvm[i] = 0
-            except Exception:
-                pass
-        
-        # Force flash write mode for recovery
-        set_nvm_flag(FLASH_WRITE_FLAG_ADDR, True)
+        # Clear all NVM flags but force flash write mode for recovery,
+        # as a single slice write rather than eleven single-byte writes
+        flags = bytearray(10)
+        flags[FLASH_WRITE_FLAG_ADDR] = 1
+        try:
+            if microcontroller.nvm[0:10] != flags:
+                microcontroller.nvm[0:10] = flags
+        except Exception as e:
+            print(f"NVM flag reset error: {e}")
         
         print("Emergency reset complete - rebooting...")
         time.sleep(1)
@@ -964,36 +1030,32 @@ def create_boot_log():
             pass
         
         # Create log entry
-        timestamp = int(time.monotonic())
+        timestamp = time.monotonic_ns() // 1_000_000_000
         reset_type, reset_desc = analyze_reset_cause()
         
-        # Build log entry without complex f-string
-        log_entry = "\nBoot Log Entry - " + str(timestamp) + "\n"
-        log_entry += "================================\n"
-        log_entry += "Boot System Version: " + __version__ + "\n"
-        log_entry += "Reset Cause: " + reset_desc + "\n"
-        log_entry += "Recovery Mode: " + str(read_nvm_flag(RECOVERY_FLAG_ADDR)) + "\n"
-        log_entry += "Developer Mode: " + str(read_nvm_flag(DEVELOPER_MODE_FLAG_ADDR)) + "\n"
-        log_entry += "Flash Write: " + str(read_nvm_flag(FLASH_WRITE_FLAG_ADDR)) + "\n"
-        log_entry += "Reload Count: " + str(read_nvm_byte(RELOAD_COUNTER_ADDR)) + "\n"
-        log_entry += "Memory Free: " + str(gc.mem_free()) + " bytes\n"
-        
-        sd_status = "Available" if SDCARD_AVAILABLE and SD_PINS_AVAILABLE else "Not Available"
-        log_entry += "SD Card: " + sd_status + "\n"
-        
-        wifi_status = "Available" if NTP_AVAILABLE else "Not Available"
-        log_entry += "WiFi/NTP: " + wifi_status + "\n"
-        
+        # Build log entry as a list of parts, joined once for a single write
         brightness_pct = int(settings.get('DISPLAY_BRIGHTNESS', DEFAULT_BRIGHTNESS) * 100)
-        log_entry += "Display Brightness: " + str(brightness_pct) + "%\n\n"
-        
-        log_entry += "Settings:\n"
+        parts = [
+            "\nBoot Log Entry - " + str(timestamp) + "\n",
+            "================================\n",
+            "Boot System Version: " + __version__ + "\n",
+            "Reset Cause: " + reset_desc + "\n",
+            "Recovery Mode: " + str(read_nvm_flag(RECOVERY_FLAG_ADDR)) + "\n",
+            "Developer Mode: " + str(read_nvm_flag(DEVELOPER_MODE_FLAG_ADDR)) + "\n",
+            "Flash Write: " + str(read_nvm_flag(FLASH_WRITE_FLAG_ADDR)) + "\n",
+            "Reload Count: " + str(read_nvm_byte(RELOAD_COUNTER_ADDR)) + "\n",
+            "Memory Free: " + str(gc.mem_free()) + " bytes\n",
+            _SD_STATUS_LINE,
+            _WIFI_STATUS_LINE,
+            "Display Brightness: " + str(brightness_pct) + "%\n\n",
+            "Settings:\n",
+        ]
         for k, v in settings.items():
-            log_entry += "  " + str(k) + ": " + str(v) + "\n"
-        log_entry += "================================\n"
+            parts.append("  " + str(k) + ": " + str(v) + "\n")
+        parts.append("================================\n")
         
         with open("/logs/boot.log", "a") as f:
-            f.write(log_entry)
+            f.write("".join(parts))
         
         print("Boot log entry created")
         return True
@@ -1064,15 +1126,25 @@ def show_boot_menu():
         ]
         
         selected = 0
+        shown_step = -1
         start_time = time.monotonic()
         
-        while time.monotonic() - start_time < 3:
-            # Show current selection
-            show_boot_status(f"Boot Menu\n\n> {menu_options[selected]}\n\nPress button to select\nAuto-boot in {3 - int(time.monotonic() - start_time)}s", 0x00FFFF)
+        while True:
+            elapsed = time.monotonic() - start_time
+            if elapsed >= 3:
+                break
+            
+            # Advance the option once a second as before, but check the
+            # button every 20 ms
+            step = int(elapsed)
+            if step != shown_step:
+                shown_step = step
+                selected = step % len(menu_options)
+                show_boot_status(f"Boot Menu\n\n> {menu_options[selected]}\n\nPress button to select\nAuto-boot in {3 - int(elapsed)}s", 0x00FFFF, hold=0)
             
             # Check button
             if not button.value:  # Button pressed
-                time.sleep(0.1)  # Debounce
+                time.sleep(0.02)  # Debounce
                 while not button.value:  # Wait for release
                     time.sleep(0.01)
                 
@@ -1091,9 +1163,7 @@ def show_boot_menu():
                 time.sleep(1)
                 return True
             
-            # Cycle through options
-            selected = (selected + 1) % len(menu_options)
-            time.sleep(0.5)
+            time.sleep(0.02)
         
         # Auto-boot normal mode
         show_boot_status("Auto-boot: Normal Mode\n\nStarting...", 0x00FF00)
@@ -1190,11 +1260,11 @@ else:
         print(f"❌ Boot execution failed: {e}")
         emergency_reset()
 
-# Final memory cleanup
-gc.collect()
-
+# main() read free memory in its finally block; reuse that reading
+if _boot_mem_free is None:
+    _boot_mem_free = gc.mem_free()
 print(f"📦 StageTwo Boot System v{__version__} - Ready")
-print(f"💾 Final boot memory: {gc.mem_free()} bytes free")
+print(f"💾 Final boot memory: {_boot_mem_free} bytes free")
 print("🚀 System initialization complete")
 
 # End of boot.py
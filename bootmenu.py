@@ -8,11 +8,41 @@ import time
 import microcontroller
 import os
 
+try:
+    import alarm
+    ALARM_AVAILABLE = True
+except ImportError:
+    ALARM_AVAILABLE = False
+
+try:
+    import keypad
+    KEYPAD_AVAILABLE = True
+except ImportError:
+    KEYPAD_AVAILABLE = False
+
+try:
+    import vectorio
+    VECTORIO_AVAILABLE = True
+except ImportError:
+    VECTORIO_AVAILABLE = False
+
 SETTINGS_PATH = "/settings.toml"
 DEFAULT_BOOT_FILE = "app_loader.py"
 DEFAULT_TIMEOUT = 3
 
 # Helper functions for settings.toml
+def parse_flag(value):
+    # boot.py writes true/false, this menu writes 1/0
+    return value.lower() in ("true", "1", "yes", "on")
+
+# Value parser for each key the boot menu reads; other keys are ignored
+SETTING_PARSERS = {
+    "DEFAULT_BOOT_FILE": lambda value: value.replace('"', ""),
+    "BOOT_TIMEOUT": int,
+    "DEVELOPER_MODE": parse_flag,
+    "FLASH_WRITE": parse_flag,
+}
+
 def read_settings():
     settings = {
         "DEFAULT_BOOT_FILE": DEFAULT_BOOT_FILE,
@@ -20,42 +50,47 @@ def read_settings():
         "DEVELOPER_MODE": False,
         "FLASH_WRITE": False,
     }
-    if os.path.exists(SETTINGS_PATH):
+    try:
         with open(SETTINGS_PATH, "r") as f:
             for line in f:
-                if line.startswith("DEFAULT_BOOT_FILE"):
-                    settings["DEFAULT_BOOT_FILE"] = line.split("=")[1].strip().replace('"', "")
-                elif line.startswith("BOOT_TIMEOUT"):
-                    try:
-                        settings["BOOT_TIMEOUT"] = int(line.split("=")[1].strip())
-                    except Exception:
-                        pass
-                elif line.startswith("DEVELOPER_MODE"):
-                    settings["DEVELOPER_MODE"] = "True" in line or "1" in line
-                elif line.startswith("FLASH_WRITE"):
-                    settings["FLASH_WRITE"] = "True" in line or "1" in line
+                # One split and one dict lookup per line
+                parts = line.split("=", 1)
+                if len(parts) < 2:
+                    continue
+                key = parts[0].strip()
+                parse = SETTING_PARSERS.get(key)
+                if parse is None:
+                    continue
+                try:
+                    settings[key] = parse(parts[1].strip())
+                except ValueError:
+                    pass
+    except OSError:
+        pass  # No settings file yet
     return settings
 
 def save_settings(settings):
+    existing = []
     lines = []
-    if os.path.exists(SETTINGS_PATH):
+    try:
         with open(SETTINGS_PATH, "r") as f:
             for line in f:
-                if line.startswith("DEFAULT_BOOT_FILE"):
-                    continue
-                elif line.startswith("BOOT_TIMEOUT"):
-                    continue
-                elif line.startswith("DEVELOPER_MODE"):
-                    continue
-                elif line.startswith("FLASH_WRITE"):
+                existing.append(line)
+                if line.split("=", 1)[0].strip() in SETTING_PARSERS:
                     continue
                 lines.append(line)
+    except OSError:
+        pass  # No settings file yet
     lines.append(f'DEFAULT_BOOT_FILE = "{settings["DEFAULT_BOOT_FILE"]}"\n')
     lines.append(f'BOOT_TIMEOUT = {settings["BOOT_TIMEOUT"]}\n')
     lines.append(f'DEVELOPER_MODE = {int(settings["DEVELOPER_MODE"])}\n')
     lines.append(f'FLASH_WRITE = {int(settings["FLASH_WRITE"])}\n')
+    # Rewriting an identical file still costs a flash erase/program cycle
+    new_text = "".join(lines)
+    if new_text == "".join(existing):
+        return
     with open(SETTINGS_PATH, "w") as f:
-        f.writelines(lines)
+        f.write(new_text)
 
 settings = read_settings()
 
@@ -73,38 +108,127 @@ display = board.DISPLAY
 group = displayio.Group()
 display.root_group = group
 
-button = digitalio.DigitalInOut(board.BUTTON)
-button.direction = digitalio.Direction.INPUT
-button.pull = digitalio.Pull.UP
+LONG_PRESS_MS = 1000
+
+class ButtonInput:
+    # Short/long press detection on board.BUTTON. keypad queues debounced,
+    # timestamped edges in the background, so it only needs polling every
+    # 100 ms; without it fall back to sampling the pin every 20 ms.
+    def __init__(self):
+        self.keys = None
+        self.pin = None
+        self.press_ms = None
+        self.long_fired = False
+        self.open()
+
+    def open(self):
+        if KEYPAD_AVAILABLE:
+            self.keys = keypad.Keys((board.BUTTON,), value_when_pressed=False, pull=True)
+            self.poll_interval = 0.1
+        else:
+            self.pin = digitalio.DigitalInOut(board.BUTTON)
+            self.pin.direction = digitalio.Direction.INPUT
+            self.pin.pull = digitalio.Pull.UP
+            self.last_value = True  # Treat a button held at open (e.g. the wake press) as a new press
+            self.poll_interval = 0.02
+
+    def deinit(self):
+        if self.keys is not None:
+            self.keys.deinit()
+            self.keys = None
+        if self.pin is not None:
+            self.pin.deinit()
+            self.pin = None
+
+    @property
+    def idle(self):
+        return self.press_ms is None
+
+    def _pressed(self, now_ms):
+        self.press_ms = now_ms
+        self.long_fired = False
+
+    def _released(self):
+        short = self.press_ms is not None and not self.long_fired
+        self.press_ms = None
+        return short
+
+    def poll(self):
+        # Return "long" once while held past LONG_PRESS_MS, "short" on an
+        # earlier release, otherwise None
+        if self.keys is not None:
+            event = self.keys.events.get()
+            while event is not None:
+                if event.pressed:
+                    self._pressed(event.timestamp)
+                elif self._released():
+                    return "short"
+                event = self.keys.events.get()
+        else:
+            value = self.pin.value
+            if value != self.last_value:
+                self.last_value = value
+                if not value:
+                    self._pressed(supervisor.ticks_ms())
+                elif self._released():
+                    return "short"
+        if self.press_ms is not None and not self.long_fired:
+            # ticks_ms() wraps at 2**29
+            if (supervisor.ticks_ms() - self.press_ms) & 0x1FFFFFFF > LONG_PRESS_MS:
+                self.long_fired = True
+                return "long"
+        return None
+
+button = ButtonInput()
 
 selected = 0
 
-def draw_menu(selected_index):
-    if len(group) > 0:
-        group.pop()
+# Shared by every menu's highlight bar
+highlight_palette = displayio.Palette(1)
+highlight_palette[0] = 0x003366
+
+def build_menu(title, items):
+    # Build the widgets once; show_menu only recolors labels and moves the highlight
     menu_group = displayio.Group()
-    title = label.Label(
-        terminalio.FONT, text="Boot Menu", color=0x00FFFF, x=10, y=8, scale=2
+    title_label = label.Label(
+        terminalio.FONT, text=title, color=0x00FFFF, x=10, y=8, scale=2
     )
-    menu_group.append(title)
-    for i, (item, _) in enumerate(MENU_ITEMS):
-        y = 30 + i * 24
-        if i == selected_index:
-            highlight_bitmap = displayio.Bitmap(120, 20, 1)
-            highlight_palette = displayio.Palette(1)
-            highlight_palette[0] = 0x003366
-            highlight_tile = displayio.TileGrid(
-                highlight_bitmap, pixel_shader=highlight_palette, x=6, y=y - 12
-            )
-            menu_group.append(highlight_tile)
-            color = 0xFFFF00
-        else:
-            color = 0xFFFFFF
+    menu_group.append(title_label)
+    # A vectorio shape is one object with no backing bitmap
+    if VECTORIO_AVAILABLE:
+        highlight = vectorio.Rectangle(
+            pixel_shader=highlight_palette, width=120, height=20, x=6, y=30 - 12
+        )
+    else:
+        highlight = displayio.TileGrid(
+            displayio.Bitmap(120, 20, 1), pixel_shader=highlight_palette, x=6, y=30 - 12
+        )
+    menu_group.append(highlight)
+    labels = []
+    for i, item in enumerate(items):
         text = label.Label(
-            terminalio.FONT, text=item, color=color, x=10, y=y
+            terminalio.FONT, text=item, color=0xFFFFFF, x=10, y=30 + i * 24
         )
+        labels.append(text)
         menu_group.append(text)
-    group.append(menu_group)
+    return menu_group, labels, highlight
+
+def show_menu(menu, selected_index):
+    menu_group, labels, highlight = menu
+    for i, text in enumerate(labels):
+        color = 0xFFFF00 if i == selected_index else 0xFFFFFF
+        if text.color != color:
+            text.color = color
+    highlight.y = 30 + selected_index * 24 - 12
+    if len(group) == 0 or group[0] is not menu_group:
+        while len(group) > 0:
+            group.pop()
+        group.append(menu_group)
+
+main_menu = build_menu("Boot Menu", [item for item, _ in MENU_ITEMS])
+
+def draw_menu(selected_index):
+    show_menu(main_menu, selected_index)
 
 def settings_menu():
     idx = 0
@@ -115,118 +239,127 @@ def settings_menu():
         f"Flash Write: {'ON' if settings['FLASH_WRITE'] else 'OFF'}",
         "Back"
     ]
+    menu = build_menu("Boot Settings", options)
     while True:
-        if len(group) > 0:
-            group.pop()
-        menu_group = displayio.Group()
-        title = label.Label(
-            terminalio.FONT, text="Boot Settings", color=0x00FFFF, x=10, y=8, scale=2
-        )
-        menu_group.append(title)
-        for i, item in enumerate(options):
-            y = 30 + i * 24
-            if i == idx:
-                highlight_bitmap = displayio.Bitmap(120, 20, 1)
-                highlight_palette = displayio.Palette(1)
-                highlight_palette[0] = 0x003366
-                highlight_tile = displayio.TileGrid(
-                    highlight_bitmap, pixel_shader=highlight_palette, x=6, y=y - 12
-                )
-                menu_group.append(highlight_tile)
-                color = 0xFFFF00
-            else:
-                color = 0xFFFFFF
-            text = label.Label(
-                terminalio.FONT, text=item, color=color, x=10, y=y
-            )
-            menu_group.append(text)
-        group.append(menu_group)
+        # Only relabel options whose value changed
+        for text, item in zip(menu[1], options):
+            if text.text != item:
+                text.text = item
+        show_menu(menu, idx)
 
-        last_button = button.value
         while True:
-            if not button.value and last_button:
-                press_time = time.monotonic()
-                while not button.value:
-                    if time.monotonic() - press_time > 1.0:
-                        # Long press: select
-                        if idx == 0:
-                            # Boot file select
-                            bf_idx = BOOT_FILES.index(settings["DEFAULT_BOOT_FILE"]) if settings["DEFAULT_BOOT_FILE"] in BOOT_FILES else 0
-                            bf_idx = (bf_idx + 1) % len(BOOT_FILES)
-                            settings["DEFAULT_BOOT_FILE"] = BOOT_FILES[bf_idx]
-                            options[0] = f"Boot File: {settings['DEFAULT_BOOT_FILE']}"
-                        elif idx == 1:
-                            # Timeout adjust
-                            settings["BOOT_TIMEOUT"] = (settings["BOOT_TIMEOUT"] + 1) % 11 or 1
-                            options[1] = f"Timeout: {settings['BOOT_TIMEOUT']}s"
-                        elif idx == 2:
-                            # Toggle developer mode
-                            settings["DEVELOPER_MODE"] = not settings["DEVELOPER_MODE"]
-                            options[2] = f"Developer Mode: {'ON' if settings['DEVELOPER_MODE'] else 'OFF'}"
-                        elif idx == 3:
-                            # Toggle flash write
-                            settings["FLASH_WRITE"] = not settings["FLASH_WRITE"]
-                            options[3] = f"Flash Write: {'ON' if settings['FLASH_WRITE'] else 'OFF'}"
-                        elif idx == 4:
-                            save_settings(settings)
-                            return
-                        save_settings(settings)
-                        break
-                    time.sleep(0.01)
-                else:
-                    # Short press: next option
-                    idx = (idx + 1) % len(options)
-                    break
-            last_button = button.value
-            time.sleep(0.02)
+            action = button.poll()
+            if action == "long":
+                # Long press: select
+                if idx == 0:
+                    # Boot file select
+                    bf_idx = BOOT_FILES.index(settings["DEFAULT_BOOT_FILE"]) if settings["DEFAULT_BOOT_FILE"] in BOOT_FILES else 0
+                    bf_idx = (bf_idx + 1) % len(BOOT_FILES)
+                    settings["DEFAULT_BOOT_FILE"] = BOOT_FILES[bf_idx]
+                    options[0] = f"Boot File: {settings['DEFAULT_BOOT_FILE']}"
+                elif idx == 1:
+                    # Timeout adjust
+                    settings["BOOT_TIMEOUT"] = (settings["BOOT_TIMEOUT"] + 1) % 11 or 1
+                    options[1] = f"Timeout: {settings['BOOT_TIMEOUT']}s"
+                elif idx == 2:
+                    # Toggle developer mode
+                    settings["DEVELOPER_MODE"] = not settings["DEVELOPER_MODE"]
+                    options[2] = f"Developer Mode: {'ON' if settings['DEVELOPER_MODE'] else 'OFF'}"
+                elif idx == 3:
+                    # Toggle flash write
+                    settings["FLASH_WRITE"] = not settings["FLASH_WRITE"]
+                    options[3] = f"Flash Write: {'ON' if settings['FLASH_WRITE'] else 'OFF'}"
+                elif idx == 4:
+                    # Changes are written once, on leaving the menu
+                    save_settings(settings)
+                    return
+                break
+            elif action == "short":
+                # Short press: next option
+                idx = (idx + 1) % len(options)
+                break
+            time.sleep(button.poll_interval)
+
+def launch(code_file):
+    supervisor.set_next_code_file(code_file)
+    supervisor.reload()
+
+def boot_default():
+    launch(settings["DEFAULT_BOOT_FILE"])
+
+def open_settings():
+    settings_menu()
+    draw_menu(selected)
+
+def run_factory():
+    # Set first boot setup flag before rebooting
+    FIRST_BOOT_SETUP_FLAG_ADDR = 8
+    microcontroller.nvm[FIRST_BOOT_SETUP_FLAG_ADDR] = 1
+    launch("factory.py")
+
+def run_backup():
+    # Import and call backup from recovery.py
+    try:
+        import recovery
+        rec = recovery.RecoverySystem()
+        result = rec.backup_system_files()
+        msg = "Backup complete!" if result else "Backup failed!"
+    except Exception as e:
+        msg = f"Backup error: {e}"
+    # Show result on display
+    if len(group) > 0:
+        group.pop()
+    msg_group = displayio.Group()
+    msg_label = label.Label(terminalio.FONT, text=msg, color=0x00FF00 if "complete" in msg else 0xFF0000, x=10, y=60, scale=2)
+    msg_group.append(msg_label)
+    group.append(msg_group)
+    time.sleep(2)
+    draw_menu(selected)
+
+# Menu actions with their own handler; any other action is a code file to launch
+ACTIONS = {
+    "boot": boot_default,
+    "settings": open_settings,
+    "factory.py": run_factory,
+    "backup": run_backup,
+}
 
 def run_action(index):
     name, action = MENU_ITEMS[index]
-    if action == "boot":
-        supervisor.set_next_code_file(settings["DEFAULT_BOOT_FILE"])
-        supervisor.reload()
-    elif action == "settings":
-        settings_menu()
-        draw_menu(selected)
-    elif action == "factory.py":
-        # Set first boot setup flag before rebooting
-        FIRST_BOOT_SETUP_FLAG_ADDR = 8
-        microcontroller.nvm[FIRST_BOOT_SETUP_FLAG_ADDR] = 1
-        supervisor.set_next_code_file(action)
-        supervisor.reload()
-    elif action == "backup":
-        # Import and call backup from recovery.py
-        try:
-            import recovery
-            rec = recovery.RecoverySystem()
-            result = rec.backup_system_files()
-            msg = "Backup complete!" if result else "Backup failed!"
-        except Exception as e:
-            msg = f"Backup error: {e}"
-        # Show result on display
-        if len(group) > 0:
-            group.pop()
-        msg_group = displayio.Group()
-        msg_label = label.Label(terminalio.FONT, text=msg, color=0x00FF00 if "complete" in msg else 0xFF0000, x=10, y=60, scale=2)
-        msg_group.append(msg_label)
-        group.append(msg_group)
-        time.sleep(2)
-        draw_menu(selected)
+    handler = ACTIONS.get(action)
+    if handler is None:
+        launch(action)
     else:
-        supervisor.set_next_code_file(action)
-        supervisor.reload()
+        handler()
+
+def idle_until_input(deadline):
+    # Light-sleep until the button goes down or the auto-boot deadline passes.
+    # Over USB light sleep saves nothing and would stall the serial console.
+    if not ALARM_AVAILABLE or supervisor.runtime.usb_connected:
+        return
+    if deadline <= time.monotonic():
+        return
+    button.deinit()  # PinAlarm needs the pin
+    try:
+        time_alarm = alarm.time.TimeAlarm(monotonic_time=deadline)
+        pin_alarm = alarm.pin.PinAlarm(pin=board.BUTTON, value=False, pull=True)
+        alarm.light_sleep_until_alarms(time_alarm, pin_alarm)
+    except Exception as e:
+        print(f"Light sleep unavailable: {e}")
+    finally:
+        button.open()
 
 def menu_loop():
     global selected
     draw_menu(selected)
-    last_button = button.value
     start_time = time.monotonic()
     timeout = settings["BOOT_TIMEOUT"]
-    button_press_time = None
     prev_selected = selected
-    long_press_handled = False
 
     while True:
+        # Nothing in progress: sleep until a press or the timeout instead of polling
+        if button.idle:
+            idle_until_input(start_time + timeout)
         input_received = False
         # Console control
         if supervisor.runtime.serial_bytes_available:
@@ -243,32 +376,26 @@ def menu_loop():
             else:
                 print("Commands: up/down/select or 0-3")
         # Button navigation
-        if not button.value and last_button:
-            button_press_time = time.monotonic()
-            long_press_handled = False
-        elif not button.value and button_press_time is not None:
-            if not long_press_handled and (time.monotonic() - button_press_time > 1.0):
-                run_action(selected)
-                long_press_handled = True
-        elif button.value and not last_button:
-            if button_press_time is not None and not long_press_handled:
-                selected = (selected + 1) % len(MENU_ITEMS)
-                input_received = True
-            button_press_time = None
-            long_press_handled = False
-        last_button = button.value
+        action = button.poll()
+        if action == "long":
+            run_action(selected)
+        elif action == "short":
+            selected = (selected + 1) % len(MENU_ITEMS)
+            input_received = True
 
         if selected != prev_selected:
             draw_menu(selected)
             prev_selected = selected
 
+        # One clock read per pass, after any sleep or blocking console input
+        now = time.monotonic()
         if input_received:
-            start_time = time.monotonic()
-        if time.monotonic() - start_time > timeout:
+            start_time = now
+        if now - start_time > timeout:
             print(f"Timeout reached. Booting default: {MENU_ITEMS[selected][0]}")
             run_action(selected)
 
-        time.sleep(0.02)
+        time.sleep(button.poll_interval)
 
 draw_menu(selected)
 print("Boot Menu: Use button or console (up/down/select/0-3)")
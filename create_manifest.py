@@ -1,77 +1,138 @@
-import json
 import os
 
-def create_system_manifest():
-    """Create a comprehensive system manifest"""
+# Manifest written to /system/manifest.json by create_system_manifest()
+SYSTEM_MANIFEST = {
+    # Core system files
+    "boot.py": {
+        "required": True,
+        "description": "Boot loader and system initialization",
+        "category": "system"
+    },
+    "code.py": {
+        "required": True, 
+        "description": "Main application entry point",
+        "category": "system"
+    },
+    "recovery.py": {
+        "required": True,
+        "description": "Recovery system",
+        "category": "system"
+    },
     
-    manifest = {
-        # Core system files
-        "boot.py": {
-            "required": True,
-            "description": "Boot loader and system initialization",
-            "category": "system"
-        },
-        "code.py": {
-            "required": True, 
-            "description": "Main application entry point",
-            "category": "system"
-        },
-        "recovery.py": {
-            "required": True,
-            "description": "Recovery system",
-            "category": "system"
-        },
-        
-        # Application files
-        "bootmenu.py": {
-            "required": False,
-            "description": "Boot menu interface",
-            "category": "application"
-        },
-        "loader.py": {
-            "required": False,
-            "description": "Application loader",
-            "category": "application"
-        },
-        
-        # Configuration files
-        "settings.toml": {
-            "required": False,
-            "description": "System configuration",
-            "category": "config"
-        },
-        
-        # Directories
-        "lib/": {
-            "required": True,
-            "description": "CircuitPython libraries",
-            "category": "system"
-        },
-        "system/": {
-            "required": True,
-            "description": "System files and recovery data",
-            "category": "system"
-        },
-        
-        # Recovery files
-        "system/recovery.zip": {
-            "required": True,
-            "description": "Core system recovery archive",
-            "category": "recovery"
-        },
-        "system/manifest.json": {
-            "required": True,
-            "description": "System file manifest",
-            "category": "system"
-        },
-        
-        # Media files
-        "stagetwo_boot.bmp": {
-            "required": False,
-            "description": "Boot splash screen",
-            "category": "media"
-        }
+    # Application files
+    "bootmenu.py": {
+        "required": False,
+        "description": "Boot menu interface",
+        "category": "application"
+    },
+    "loader.py": {
+        "required": False,
+        "description": "Application loader",
+        "category": "application"
+    },
+    
+    # Configuration files
+    "settings.toml": {
+        "required": False,
+        "description": "System configuration",
+        "category": "config"
+    },
+    
+    # Directories
+    "lib/": {
+        "required": True,
+        "description": "CircuitPython libraries",
+        "category": "system"
+    },
+    "system/": {
+        "required": True,
+        "description": "System files and recovery data",
+        "category": "system"
+    },
+    
+    # Recovery files
+    "system/recovery.zip": {
+        "required": True,
+        "description": "Core system recovery archive",
+        "category": "recovery"
+    },
+    "system/manifest.json": {
+        "required": True,
+        "description": "System file manifest",
+        "category": "system"
+    },
+    
+    # Media files
+    "stagetwo_boot.bmp": {
+        "required": False,
+        "description": "Boot splash screen",
+        "category": "media"
     }
+}
+
+# SYSTEM_MANIFEST pre-encoded (json.dumps(SYSTEM_MANIFEST, indent=2)) so the
+# board writes a constant instead of encoding the dict; keep the two in sync
+_MANIFEST_JSON = """{
+  "boot.py": {
+    "required": true,
+    "description": "Boot loader and system initialization",
+    "category": "system"
+  },
+  "code.py": {
+    "required": true,
+    "description": "Main application entry point",
+    "category": "system"
+  },
+  "recovery.py": {
+    "required": true,
+    "description": "Recovery system",
+    "category": "system"
+  },
+  "bootmenu.py": {
+    "required": false,
+    "description": "Boot menu interface",
+    "category": "application"
+  },
+  "loader.py": {
+    "required": false,
+    "description": "Application loader",
+    "category": "application"
+  },
+  "settings.toml": {
+    "required": false,
+    "description": "System configuration",
+    "category": "config"
+  },
+  "lib/": {
+    "required": true,
+    "description": "CircuitPython libraries",
+    "category": "system"
+  },
+  "system/": {
+    "required": true,
+    "description": "System files and recovery data",
+    "category": "system"
+  },
+  "system/recovery.zip": {
+    "required": true,
+    "description": "Core system recovery archive",
+    "category": "recovery"
+  },
+  "system/manifest.json": {
+    "required": true,
+    "description": "System file manifest",
+    "category": "system"
+  },
+  "stagetwo_boot.bmp": {
+    "required": false,
+    "description": "Boot splash screen",
+    "category": "media"
+  }
+}
+"""
+
+def create_system_manifest():
+    """Create a comprehensive system manifest"""
     
     # Ensure system directory exists
     try:
@@ -81,10 +142,10 @@ def create_system_manifest():
         
     # Write manifest
     with open("/system/manifest.json", "w") as f:
-        json.dump(manifest, f, indent=2)
+        f.write(_MANIFEST_JSON)
         
     print("System manifest created successfully")
-    return manifest
+    return SYSTEM_MANIFEST
 
 if __name__ == "__main__":
     create_system_manifest()
@@ -6,20 +6,115 @@ import digitalio
 import supervisor
 import time
 import os
+import gc
+
+try:
+    import keypad
+    KEYPAD_AVAILABLE = True
+except ImportError:
+    KEYPAD_AVAILABLE = False
+
+try:
+    import vectorio
+    VECTORIO_AVAILABLE = True
+except ImportError:
+    VECTORIO_AVAILABLE = False
 
 STATUS_BAR_HEIGHT = 15
 SCREEN_WIDTH = board.DISPLAY.width
 SCREEN_HEIGHT = board.DISPLAY.height
 MENU_START_Y = STATUS_BAR_HEIGHT + 10
+# MicroPython's ilistdir yields type and size with each name, so no stat is
+# needed; CircuitPython only has listdir
+_ilistdir = getattr(os, "ilistdir", None)
+
+DIR_CACHE_SIZE = 8  # Scanned directory listings kept in RAM
+LARGE_DIR_ENTRIES = 200  # Above this, entries are built only when shown
+LAZY_WINDOW = 32  # Built entries a large listing keeps at once
+# File list colors
+SELECTED_COLOR = 0x00FF00  # Green for selected
+DIR_COLOR = 0x0080FF  # Blue for directories
+PY_COLOR = 0xFFFF00  # Yellow for Python files
+FILE_COLOR = 0xFFFFFF  # White for other files
+
+# File list columns: name at the left, size right-aligned in its own label
+SIZE_COLUMN_X = SCREEN_WIDTH - 40
+SIZE_RIGHT_X = SCREEN_WIDTH - 5
+NAME_CHARS = (SIZE_COLUMN_X - 10) // 6 - 3  # terminalio glyphs are 6px wide; minus "> " and a gap
+
+MESSAGE_LINE_CHARS = 35  # Characters per message line that fit on screen
+MAX_ACTIONS = 8  # Longest action menu: Run, View, Edit, Rename, Delete, Properties, Back, Exit
+
+def _update_label(text_label, text, color=None):
+    """Update a label only when its text or color actually changes"""
+    # Assigning .text re-lays out every glyph even when nothing changed
+    if text_label.text != text:
+        text_label.text = text
+    if color is not None and text_label.color != color:
+        text_label.color = color
+
+def _parent_path(path):
+    """Return the directory containing path ("/" for top-level entries)"""
+    path = path.rstrip("/")
+    return path[:path.rfind("/")] or "/"
+
+class _BatchedRefresh:
+    """Hold display auto refresh while a screen is rewritten"""
+    # Label changes made with auto refresh on can each trigger a refresh of
+    # their own region; holding it lets the next refresh draw them all at once
+    def __init__(self, display):
+        self.display = display
+    
+    def __enter__(self):
+        self.display.auto_refresh = False
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.display.auto_refresh = True
+
+class _LazyListing:
+    """Large directory listing that stats and formats entries only when shown"""
+    # Holds just the names; the browser reads a few rows around the selection,
+    # so at most LAZY_WINDOW entry dicts exist however big the directory is
+    def __init__(self, stat_entry, prefix, names, parent=None):
+        self._stat_entry = stat_entry
+        self._prefix = prefix
+        self._names = names
+        self._parent = parent
+        self._entries = {}
+    
+    def __len__(self):
+        return len(self._names) + (self._parent is not None)
+    
+    def __getitem__(self, index):
+        if self._parent is not None:
+            if index == 0:
+                return self._parent
+            index -= 1
+        entry = self._entries.get(index)
+        if entry is None:
+            name = self._names[index]
+            if len(self._entries) >= LAZY_WINDOW:
+                self._entries.clear()
+            entry = self._stat_entry(name, self._prefix + name)
+            self._entries[index] = entry
+        return entry
 
 class StatusBar:
     def __init__(self, display_group):
         self.group = displayio.Group()
         self.display_group = display_group
-        self.bg_bitmap = displayio.Bitmap(SCREEN_WIDTH, STATUS_BAR_HEIGHT, 1)
         self.bg_palette = displayio.Palette(1)
         self.bg_palette[0] = 0x001122
-        self.bg_sprite = displayio.TileGrid(self.bg_bitmap, pixel_shader=self.bg_palette, x=0, y=0)
+        # A vectorio shape is one object with no backing bitmap
+        if VECTORIO_AVAILABLE:
+            self.bg_sprite = vectorio.Rectangle(
+                pixel_shader=self.bg_palette,
+                width=SCREEN_WIDTH, height=STATUS_BAR_HEIGHT, x=0, y=0
+            )
+        else:
+            self.bg_bitmap = displayio.Bitmap(SCREEN_WIDTH, STATUS_BAR_HEIGHT, 1)
+            self.bg_sprite = displayio.TileGrid(self.bg_bitmap, pixel_shader=self.bg_palette, x=0, y=0)
         self.group.append(self.bg_sprite)
         self.status_label = label.Label(
             terminalio.FONT, text="Ready", color=0xFFFFFF, x=10, y=6
@@ -28,20 +123,25 @@ class StatusBar:
         self.display_group.append(self.group)
         
     def set_status(self, status_text, color=0xFFFFFF):
-        self.status_label.text = status_text[:30]
-        self.status_label.color = color
+        _update_label(self.status_label, status_text[:30], color)
 
 class FileManager:
     def __init__(self):
         self.display = board.DISPLAY
         self.main_group = displayio.Group()
         self.display.root_group = self.main_group
+        self._batch = _BatchedRefresh(self.display)
         self.status_bar = StatusBar(self.main_group)
         
+        self._keys = None
         try:
-            self.button = digitalio.DigitalInOut(board.BUTTON)
-            self.button.direction = digitalio.Direction.INPUT
-            self.button.pull = digitalio.Pull.UP
+            if KEYPAD_AVAILABLE:
+                # keypad debounces and timestamps edges in the background
+                self._keys = keypad.Keys((board.BUTTON,), value_when_pressed=False, pull=True)
+            else:
+                self.button = digitalio.DigitalInOut(board.BUTTON)
+                self.button.direction = digitalio.Direction.INPUT
+                self.button.pull = digitalio.Pull.UP
             self.has_button = True
         except:
             self.has_button = False
@@ -51,6 +151,16 @@ class FileManager:
         self.selected_index = 0
         self.files = []
         self.running = True
+        # Screens are built on first use, then updated in place
+        self._file_group = None
+        self._action_group = None
+        self._message_group = None
+        self._shown_path = None
+        self._dirty = True  # File list needs redrawing
+        self._list_top = 0  # Index of the file in the first visible row
+        self._path_text = ""
+        # Scanned listings by path; revisiting a directory skips listdir/stat
+        self._dir_cache = {}
         
     def _is_directory(self, path):
         """Check if path is a directory"""
@@ -70,62 +180,109 @@ class FileManager:
     
     def _format_size(self, size):
         """Format file size for display"""
-        if size < 1024:
-            return f"{size}B"
-        elif size < 1024 * 1024:
-            return f"{size//1024}K"
+        # Shift down one unit at a time; MicroPython ints lack bit_length()
+        unit = 0
+        while size >= 1024 and unit < 3:
+            size >>= 10
+            unit += 1
+        return f"{size}{'BKMG'[unit]}"
+    
+    def _cache_listing(self, path, file_list):
+        """Remember a scanned listing, evicting one entry when the cache is full"""
+        if path not in self._dir_cache and len(self._dir_cache) >= DIR_CACHE_SIZE:
+            self._dir_cache.pop(next(iter(self._dir_cache)))
+        self._dir_cache[path] = file_list
+    
+    def _invalidate_listing(self, *paths):
+        """Drop cached listings after the filesystem changed"""
+        for path in paths:
+            self._dir_cache.pop(path, None)
+    
+    def _make_entry(self, name, path, is_dir, size):
+        """Build a file list entry with its row text and color precomputed"""
+        # Formatted once per scan so redraws only add the selection marker
+        # No padding: each label's bitmap is only as wide as its text
+        if is_dir:
+            display = f"[{name[:NAME_CHARS - 2]}]"
+            size_text = ""
+            color = DIR_COLOR
         else:
-            return f"{size//(1024*1024)}M"
+            display = name[:NAME_CHARS]
+            size_text = self._format_size(size)
+            color = PY_COLOR if name.endswith(".py") else FILE_COLOR
+        return {
+            "name": name,
+            "path": path,
+            "is_dir": is_dir,
+            "size": size,
+            "display": display,
+            "size_text": size_text,
+            "color": color,
+            # Directories first, then files, both alphabetically
+            "sort_key": (0 if is_dir else 1, name.lower())
+        }
+    
+    def _stat_entry(self, name, item_path):
+        """Build the entry for one path from a single stat"""
+        # One stat per entry gives both the type and the size
+        try:
+            st = os.stat(item_path)
+            is_dir = bool(st[0] & 0x4000)
+            size = 0 if is_dir else st[6]
+        except OSError:
+            is_dir = False
+            size = 0
+        return self._make_entry(name, item_path, is_dir, size)
     
     def _scan_directory(self, path):
         """Scan directory and return sorted file list"""
+        cached = self._dir_cache.get(path)
+        if cached is not None:
+            return cached
         try:
-            items = os.listdir(path)
             file_list = []
             
             # Add parent directory entry if not at root
+            parent = None
             if path != "/":
-                file_list.append({
-                    "name": "..",
-                    "path": "/".join(path.rstrip("/").split("/")[:-1]) or "/",
-                    "is_dir": True,
-                    "size": 0
-                })
+                parent = self._make_entry("..", _parent_path(path), True, 0)
+                file_list.append(parent)
             
-            # Process items
-            for item in items:
-                if item.startswith("."):
-                    continue  # Skip hidden files
-                    
-                item_path = path.rstrip("/") + "/" + item
-                is_dir = self._is_directory(item_path)
-                size = 0 if is_dir else self._get_file_size(item_path)
-                
-                file_list.append({
-                    "name": item,
-                    "path": item_path,
-                    "is_dir": is_dir,
-                    "size": size
-                })
+            # Process items (join prefix computed once, not per item; shared
+            # with a lazy listing)
+            prefix = path if path.endswith("/") else path + "/"
+            if _ilistdir is not None:
+                for entry in _ilistdir(path):
+                    item = entry[0]
+                    if item.startswith("."):
+                        continue  # Skip hidden files
+                    is_dir = bool(entry[1] & 0x4000)
+                    size = entry[3] if len(entry) > 3 and not is_dir and entry[3] > 0 else 0
+                    file_list.append(self._make_entry(item, prefix + item, is_dir, size))
+            else:
+                # Skip hidden files
+                names = [item for item in os.listdir(path) if not item.startswith(".")]
+                if len(names) > LARGE_DIR_ENTRIES:
+                    # Name order only: directories can't be grouped first
+                    # without stat'ing every entry up front
+                    names.sort(key=str.lower)
+                    listing = _LazyListing(self._stat_entry, prefix, names, parent)
+                    self._cache_listing(path, listing)
+                    return listing
+                for item in names:
+                    file_list.append(self._stat_entry(item, prefix + item))
             
-            # Sort: directories first, then files, both alphabetically
-            file_list.sort(key=lambda x: (not x["is_dir"], x["name"].lower()))
+            # MicroPython calls key per comparison; sort_key is built once per entry
+            file_list.sort(key=lambda x: x["sort_key"])
+            self._cache_listing(path, file_list)
             return file_list
             
         except Exception as e:
             print(f"Error scanning directory {path}: {e}")
             return []
     
-    def _draw_file_list(self):
-        """Draw the file browser interface"""
-        # Clear main group but keep status bar
-        while len(self.main_group) > 1:
-            self.main_group.pop()
-        
-        # Update status bar
-        self.status_bar.set_status(f"Path: {self.current_path}")
-        
-        # Create file list group
+    def _build_file_group(self):
+        """Create the file browser widgets once so redraws only update them"""
         file_group = displayio.Group()
         
         # Title
@@ -139,92 +296,168 @@ class FileManager:
         file_group.append(title)
         
         # Current path
-        path_label = label.Label(
+        self._path_label = label.Label(
             terminalio.FONT,
-            text=f"Path: {self.current_path}",
+            text="",
             color=0xFFFF00,
             x=10,
             y=MENU_START_Y + 25
         )
-        file_group.append(path_label)
+        file_group.append(self._path_label)
         
-        # File list
-        if not self.files:
-            no_files_label = label.Label(
+        # One label per visible row, reused for whichever file scrolls into it
+        list_start_y = MENU_START_Y + 45
+        self._max_visible = (SCREEN_HEIGHT - list_start_y - 30) // 12
+        self._row_labels = []
+        self._row_size_labels = []
+        for row in range(self._max_visible):
+            row_label = label.Label(
                 terminalio.FONT,
-                text="No files found",
-                color=0xFF0000,
+                text="",
+                color=0xFFFFFF,
                 x=10,
-                y=MENU_START_Y + 45
+                y=list_start_y + row * 12
+            )
+            self._row_labels.append(row_label)
+            file_group.append(row_label)
+            size_label = label.Label(
+                terminalio.FONT,
+                text="",
+                color=0xFFFFFF,
+                anchor_point=(1.0, 0.5),
+                anchored_position=(SIZE_RIGHT_X, list_start_y + row * 12)
             )
-            file_group.append(no_files_label)
+            self._row_size_labels.append(size_label)
+            file_group.append(size_label)
+        
+        # Help text
+        help_label = label.Label(
+            terminalio.FONT,
+            text="Short: Next  Long: Action  Hold: Exit",
+            color=0x888888,
+            x=10,
+            y=SCREEN_HEIGHT - 15
+        )
+        file_group.append(help_label)
+        
+        # Position indicator
+        self._pos_label = label.Label(
+            terminalio.FONT,
+            text="",
+            color=0x888888,
+            x=SCREEN_WIDTH - 50,
+            y=SCREEN_HEIGHT - 15
+        )
+        file_group.append(self._pos_label)
+        
+        self._file_group = file_group
+    
+    def _draw_file_list(self):
+        """Draw the file browser interface"""
+        if self._file_group is None:
+            self._build_file_group()
+        
+        with self._batch:
+            self._show_content(self._file_group)
+            
+            # Path text is rebuilt only when the directory changes
+            if self.current_path != self._shown_path:
+                self._shown_path = self.current_path
+                self._path_text = f"Path: {self.current_path}"
+            
+            # Update status bar (other screens overwrite it)
+            self.status_bar.set_status(self._path_text)
+            _update_label(self._path_label, self._path_text)
+            self._update_file_rows()
+    
+    def _update_file_rows(self):
+        """Fill the row labels with the files around the selection"""
+        max_visible = self._max_visible
+        row = 0
+        if not self.files:
+            _update_label(self._row_labels[0], "No files found", 0xFF0000)
+            _update_label(self._row_size_labels[0], "")
+            row = 1
         else:
-            # Calculate visible files
-            list_start_y = MENU_START_Y + 45
-            max_visible = (SCREEN_HEIGHT - list_start_y - 30) // 12
-            start_idx = max(0, self.selected_index - max_visible // 2)
+            # Keep the window still while the selection stays inside it, so a
+            # step only changes the rows losing and gaining the marker
+            start_idx = self._list_top
+            if not start_idx <= self.selected_index < start_idx + max_visible:
+                start_idx = max(0, self.selected_index - max_visible // 2)
             end_idx = min(len(self.files), start_idx + max_visible)
             
             if end_idx - start_idx < max_visible and len(self.files) > max_visible:
                 start_idx = max(0, end_idx - max_visible)
+            self._list_top = start_idx
             
+            selected_index = self.selected_index
             for i in range(start_idx, end_idx):
                 file_info = self.files[i]
-                prefix = ">" if i == self.selected_index else " "
-                
-                # Color coding
-                if i == self.selected_index:
-                    color = 0x00FF00  # Green for selected
-                elif file_info["is_dir"]:
-                    color = 0x0080FF  # Blue for directories
-                elif file_info["name"].endswith(".py"):
-                    color = 0xFFFF00  # Yellow for Python files
+                if i == selected_index:
+                    prefix = "> "
+                    color = SELECTED_COLOR
                 else:
-                    color = 0xFFFFFF  # White for other files
-                
-                # Format display text
-                if file_info["is_dir"]:
-                    display_text = f"{prefix} [{file_info['name']}]"
-                else:
-                    size_str = self._format_size(file_info["size"])
-                    name_len = 20 - len(size_str)
-                    name = file_info["name"][:name_len]
-                    display_text = f"{prefix} {name:<{name_len}} {size_str}"
-                
-                file_label = label.Label(
-                    terminalio.FONT,
-                    text=display_text,
-                    color=color,
-                    x=10,
-                    y=list_start_y + (i - start_idx) * 12
-                )
-                file_group.append(file_label)
+                    prefix = "  "
+                    color = file_info["color"]
+                _update_label(self._row_labels[row], prefix + file_info["display"], color)
+                _update_label(self._row_size_labels[row], file_info["size_text"], color)
+                row += 1
         
-        # Help text
-        help_text = "Short: Next  Long: Action  Hold: Exit"
-        help_label = label.Label(
+        # Blank the rows below the last visible file
+        for i in range(row, max_visible):
+            _update_label(self._row_labels[i], "")
+            _update_label(self._row_size_labels[i], "")
+        
+        # Position indicator
+        pos_text = f"{self.selected_index + 1}/{len(self.files)}" if self.files else ""
+        _update_label(self._pos_label, pos_text)
+    
+    def _show_content(self, content_group):
+        """Make content_group the one screen shown below the status bar"""
+        # Swapping the single content slot leaves a shown screen untouched
+        while len(self.main_group) > 1 and self.main_group[-1] is not content_group:
+            self.main_group.pop()
+        if len(self.main_group) == 1:
+            self.main_group.append(content_group)
+    
+    def _build_action_group(self):
+        """Create the action menu widgets once so redraws only update them"""
+        action_group = displayio.Group()
+        
+        # Title
+        self._action_title = label.Label(
             terminalio.FONT,
-            text=help_text,
-            color=0x888888,
+            text="",
+            color=0x00FFFF,
             x=10,
-            y=SCREEN_HEIGHT - 15
+            y=MENU_START_Y + 10
         )
-        file_group.append(help_label)
+        action_group.append(self._action_title)
         
-        # Position indicator
-        if self.files:
-            pos_text = f"{self.selected_index + 1}/{len(self.files)}"
-            pos_label = label.Label(
+        # Action options
+        self._action_labels = []
+        for i in range(MAX_ACTIONS):
+            action_label = label.Label(
                 terminalio.FONT,
-                text=pos_text,
-                color=0x888888,
-                x=SCREEN_WIDTH - 50,
-                y=SCREEN_HEIGHT - 15
+                text="",
+                color=0xFFFFFF,
+                x=10,
+                y=MENU_START_Y + 30 + i * 15
             )
-            file_group.append(pos_label)
+            self._action_labels.append(action_label)
+            action_group.append(action_label)
         
-        self.main_group.append(file_group)
-        self.display.root_group = self.main_group
+        # Help text
+        help_label = label.Label(
+            terminalio.FONT,
+            text="Short: Next  Long: Select",
+            color=0x888888,
+            x=10,
+            y=SCREEN_HEIGHT - 20
+        )
+        action_group.append(help_label)
+        
+        self._action_group = action_group
     
     def show_action_menu(self, selected_item):
         """Show action menu for selected item with exit and back options"""
@@ -247,53 +480,22 @@ class FileManager:
         
         action_selected = 0
         
+        if self._action_group is None:
+            self._build_action_group()
+        _update_label(self._action_title, f"Actions: {file_info['name'][:15]}")
+        
         while True:
-            # Clear display and show action menu
-            while len(self.main_group) > 1:  # Keep status bar, remove everything else
-                self.main_group.pop()
-            
-            self.status_bar.set_status("Action Menu")
-            
-            # Create action menu group
-            action_group = displayio.Group()
-            
-            # Title
-            title_text = f"Actions: {file_info['name'][:15]}"
-            title = label.Label(
-                terminalio.FONT,
-                text=title_text,
-                color=0x00FFFF,
-                x=10,
-                y=MENU_START_Y + 10
-            )
-            action_group.append(title)
-            
-            # Action options
-            for i, action in enumerate(actions):
-                prefix = ">" if i == action_selected else " "
-                color = 0x00FF00 if i == action_selected else 0xFFFFFF
+            with self._batch:
+                self._show_content(self._action_group)
+                self.status_bar.set_status("Action Menu")
                 
-                action_label = label.Label(
-                    terminalio.FONT,
-                    text=f"{prefix} {action}",
-                    color=color,
-                    x=10,
-                    y=MENU_START_Y + 30 + i * 15
-                )
-                action_group.append(action_label)
-            
-            # Help text
-            help_label = label.Label(
-                terminalio.FONT,
-                text="Short: Next  Long: Select",
-                color=0x888888,
-                x=10,
-                y=SCREEN_HEIGHT - 20
-            )
-            action_group.append(help_label)
-            
-            self.main_group.append(action_group)
-            self.display.root_group = self.main_group
+                for i, action_label in enumerate(self._action_labels):
+                    if i < len(actions):
+                        prefix = ">" if i == action_selected else " "
+                        color = 0x00FF00 if i == action_selected else 0xFFFFFF
+                        _update_label(action_label, f"{prefix} {actions[i]}", color)
+                    else:
+                        _update_label(action_label, "")
             
             # Handle button input
             action = self._wait_for_button_action()
@@ -358,10 +560,20 @@ class FileManager:
     def _view_file(self, file_info):
         """View file contents"""
         try:
+            if self._message_group is None:
+                self._build_message_group()
+            
+            # Read only the lines the screen can show; long lines wrap onto
+            # the next row instead of being read whole
+            lines = [f"File: {file_info['name']}", ""]
             with open(file_info["path"], "r") as f:
-                content = f.read(500)  # Read first 500 characters
+                while len(lines) < len(self._message_labels):
+                    line = f.readline(MESSAGE_LINE_CHARS)
+                    if not line:
+                        break
+                    lines.append(line.rstrip())
             
-            self._show_message(f"File: {file_info['name']}\n\n{content}", 0x00FFFF)
+            self._show_message_lines(lines, 0x00FFFF)
             self._wait_for_button_action()
             return "continue"
             
@@ -397,6 +609,7 @@ class FileManager:
                     os.rmdir(file_info["path"])
                 else:
                     os.remove(file_info["path"])
+                self._invalidate_listing(_parent_path(file_info["path"]), file_info["path"])
                 
                 self._show_message(f"Deleted {file_info['name']}", 0x00FF00)
                 time.sleep(1)
@@ -418,8 +631,7 @@ class FileManager:
     def _show_properties(self, file_info):
         """Show file/directory properties"""
         try:
-            stat_info = os.stat(file_info["path"])
-            
+            # Type and size were read when the directory was scanned
             props = f"Properties: {file_info['name']}\n\n"
             props += f"Path: {file_info['path']}\n"
             props += f"Type: {'Directory' if file_info['is_dir'] else 'File'}\n"
@@ -439,28 +651,47 @@ class FileManager:
             time.sleep(2)
             return "continue"
     
+    def _build_message_group(self):
+        """Create one reusable label per message line that fits on screen"""
+        message_group = displayio.Group()
+        self._message_labels = []
+        for i in range((SCREEN_HEIGHT - MENU_START_Y - 20) // 15 + 1):
+            text_label = label.Label(
+                terminalio.FONT,
+                text="",
+                color=0xFFFFFF,
+                x=10,
+                y=MENU_START_Y + 20 + i * 15
+            )
+            self._message_labels.append(text_label)
+            message_group.append(text_label)
+        self._message_group = message_group
+    
     def _show_message(self, message, color=0xFFFFFF):
         """Show a message on screen"""
-        # Clear main group but keep status bar
-        while len(self.main_group) > 1:
-            self.main_group.pop()
-        
-        message_group = displayio.Group()
-        lines = message.split("\n")
-        
-        for i, line in enumerate(lines):
-            if line.strip():  # Skip empty lines
-                text_label = label.Label(
-                    terminalio.FONT,
-                    text=line[:35],  # Limit line length
-                    color=color,
-                    x=10,
-                    y=MENU_START_Y + 20 + i * 15
-                )
-                message_group.append(text_label)
-        
-        self.main_group.append(message_group)
-        self.display.root_group = self.main_group
+        self._show_message_lines(message.split("\n"), color)
+    
+    def _show_message_lines(self, lines, color=0xFFFFFF):
+        """Show already split message lines on screen"""
+        if self._message_group is None:
+            self._build_message_group()
+        with self._batch:
+            self._show_content(self._message_group)
+            for i, text_label in enumerate(self._message_labels):
+                line = lines[i] if i < len(lines) else ""
+                if line.strip():
+                    _update_label(text_label, line[:MESSAGE_LINE_CHARS], color)  # Limit line length
+                else:
+                    _update_label(text_label, "")  # Empty lines keep their slot
+    
+    def _wait_for_key(self, pressed):
+        """Block until the button is pressed (or released); return the event timestamp"""
+        while True:
+            event = self._keys.events.get()
+            if event is None:
+                time.sleep(0.05)
+            elif event.pressed == pressed:
+                return event.timestamp
     
     def _wait_for_button_action(self):
         """Wait for button action and return the type"""
@@ -468,27 +699,38 @@ class FileManager:
             time.sleep(0.5)
             return "short"  # Default action for no button
         
-        # Wait for button press
-        while self.button.value:
-            time.sleep(0.01)
-        
-        # Button is now pressed, measure duration
-        press_start = time.monotonic()
-        
-        # Wait for release
-        while not self.button.value:
-            time.sleep(0.01)
-        
-        press_duration = time.monotonic() - press_start
+        if self._keys is not None:
+            # Drop edges queued during message and error pauses; pin polling
+            # never saw them, so they must not replay as navigation
+            self._keys.events.clear()
+            # Duration comes from the event timestamps, not from polling
+            press_ms = self._wait_for_key(True)
+            release_ms = self._wait_for_key(False)
+        else:
+            # Wait for button press
+            while self.button.value:
+                time.sleep(0.01)
+            
+            # Button is now pressed, measure duration in integer ms (no floats)
+            press_ms = supervisor.ticks_ms()
+            
+            # Wait for release
+            while not self.button.value:
+                time.sleep(0.01)
+            
+            release_ms = supervisor.ticks_ms()
+            
+            # Add delay to prevent bouncing
+            time.sleep(0.15)
         
-        # Add delay to prevent bouncing
-        time.sleep(0.15)
+        # ticks_ms() wraps at 2**29
+        held_ms = (release_ms - press_ms) & 0x1FFFFFFF
         
-        if press_duration > 2.0:
+        if held_ms > 2000:
             return "hold"  # Very long press
-        elif press_duration > 1.0:
+        elif held_ms > 1000:
             return "long"  # Long press
-        elif press_duration > 0.05:
+        elif held_ms > 50:
             return "short"  # Short press
         else:
             return "none"
@@ -507,10 +749,31 @@ class FileManager:
                 if result == "exit":
                     self.running = False
                 # "back" and "continue" just return to file browser
+                self._dirty = True
+                # Actions rescan directories and read files; collect here,
+                # between screens, rather than mid-redraw
+                gc.collect()
                 
         elif action == "short":  # Short press - navigate
-            if self.files:
+            if len(self.files) > 1:
                 self.selected_index = (self.selected_index + 1) % len(self.files)
+                self._dirty = True
+    
+    def _safe_step(self):
+        """Handle one button action, reporting errors on the status bar"""
+        # Only input handling (file actions) is guarded; redraws just update
+        # labels that already exist
+        try:
+            self._handle_file_browser_input()
+        except KeyboardInterrupt:
+            print("File Manager interrupted")
+            return False
+        except Exception as e:
+            print(f"Error in file manager: {e}")
+            self.status_bar.set_status(f"Error: {str(e)[:20]}", 0xFF0000)
+            time.sleep(2)
+            self._dirty = True
+        return True
     
     def run(self):
         """Main file manager loop"""
@@ -518,17 +781,12 @@ class FileManager:
         self.files = self._scan_directory(self.current_path)
         
         while self.running:
-            try:
+            # A "none" press or a one-entry list changes nothing on screen
+            if self._dirty:
                 self._draw_file_list()
-                self._handle_file_browser_input()
-                
-            except KeyboardInterrupt:
-                print("File Manager interrupted")
+                self._dirty = False
+            if not self._safe_step():
                 break
-            except Exception as e:
-                print(f"Error in file manager: {e}")
-                self.status_bar.set_status(f"Error: {str(e)[:20]}", 0xFF0000)
-                time.sleep(2)
         
         # Clean exit message
         self._show_message("File Manager Exiting...", 0x00FF00)
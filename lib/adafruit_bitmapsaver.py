@@ -46,23 +46,18 @@ except ImportError:
 __version__ = "1.3.6"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BitmapSaver.git"
 
+_WRITE_BUFFER_SIZE = 4096
+
 
 def _write_bmp_header(output_file: BufferedWriter, filesize: int) -> None:
-    output_file.write(bytes("BM", "ascii"))
-    output_file.write(struct.pack("<I", filesize))
-    output_file.write(b"\00\x00")
-    output_file.write(b"\00\x00")
-    output_file.write(struct.pack("<I", 54))
+    # signature, file size, two reserved words, pixel data offset
+    output_file.write(struct.pack("<2sIHHI", b"BM", filesize, 0, 0, 54))
 
 
 def _write_dib_header(output_file: BufferedWriter, width: int, height: int) -> None:
-    output_file.write(struct.pack("<I", 40))
-    output_file.write(struct.pack("<I", width))
-    output_file.write(struct.pack("<I", height))
-    output_file.write(struct.pack("<H", 1))
-    output_file.write(struct.pack("<H", 24))
-    for _ in range(24):
-        output_file.write(b"\x00")
+    # header size, width, height, planes, bits per pixel, then 24 zero bytes
+    # (no compression, default resolution and palette fields)
+    output_file.write(struct.pack("<IIIHH24x", 40, width, height, 1, 24))
 
 
 def _bytes_per_row(source_width: int) -> int:
@@ -80,11 +75,10 @@ def _rotated_height_and_width(
     return pixel_source.width, pixel_source.height
 
 
-def _rgb565_to_bgr_tuple(color: int) -> Tuple[int, int, int]:
-    blue = (color << 3) & 0x00F8  # extract each of the RGB triple into it's own byte
-    green = (color >> 3) & 0x00FC
-    red = (color >> 8) & 0x00F8
-    return blue, green, red
+# 5- and 6-bit channel values scaled to 8 bits, rounded as the float formula
+# round(v / max * 255) would; built once so conversions need no float math
+_RGB5_TO_8 = bytes(round(v * 255 / 31) for v in range(32))
+_RGB6_TO_8 = bytes(round(v * 255 / 63) for v in range(64))
 
 
 def rgb565_to_rgb888(rgb565):
@@ -95,18 +89,16 @@ def rgb565_to_rgb888(rgb565):
     :return int: rgb888 color value
     """
     # Shift the red value to the right by 11 bits.
-    red5 = rgb565 >> 11
+    red5 = (rgb565 >> 11) & 0b11111
     # Shift the green value to the right by 5 bits and extract the lower 6 bits.
     green6 = (rgb565 >> 5) & 0b111111
     # Extract the lower 5 bits for blue.
     blue5 = rgb565 & 0b11111
 
-    # Convert 5-bit red to 8-bit red.
-    red8 = round(red5 / 31 * 255)
-    # Convert 6-bit green to 8-bit green.
-    green8 = round(green6 / 63 * 255)
-    # Convert 5-bit blue to 8-bit blue.
-    blue8 = round(blue5 / 31 * 255)
+    # Convert each channel to 8 bits by table lookup.
+    red8 = _RGB5_TO_8[red5]
+    green8 = _RGB6_TO_8[green6]
+    blue8 = _RGB5_TO_8[blue5]
 
     # Combine the RGB888 values into a single integer
     rgb888_value = (red8 << 16) | (green8 << 8) | blue8
@@ -121,39 +113,57 @@ def _write_pixels(
 ) -> None:
     saving_bitmap = isinstance(pixel_source, Bitmap)
     width, height = _rotated_height_and_width(pixel_source)
-    row_buffer = bytearray(_bytes_per_row(width))
-    result_buffer = False
+    row_bytes = _bytes_per_row(width)
+    # Rows are packed straight into a ~4 KB buffer that is written out whole,
+    # so the filesystem sees a few large writes instead of one per row
+    batch_bytes = row_bytes * max(1, _WRITE_BUFFER_SIZE // row_bytes)
+    # One spare byte so the last pixel's 4-byte pack stays in bounds; colors
+    # are 24-bit, so the extra byte written is always 0 (padding stays zero)
+    out_buf = bytearray(batch_bytes + 1)
+    out_view = memoryview(out_buf)
+    offset = 0
+    pack_into = struct.pack_into
+    if not saving_bitmap:
+        # Reused for every row; fill_row overwrites the row's bytes each time
+        result_buffer = bytearray(max(2048, width * 2))
+    # save_pixels guarantees a Palette or ColorConverter for a Bitmap; pick the
+    # lookup once instead of type-checking every pixel
+    use_palette = isinstance(palette, Palette)
     for y in range(height, 0, -1):
-        buffer_index = 0
+        buffer_index = offset
         if saving_bitmap:
             # pixel_source: Bitmap
-            for x in range(width):
-                pixel = pixel_source[x, y - 1]
-                if isinstance(palette, Palette):
-                    color = palette[pixel]  # handled by save_pixel's guardians
-                elif isinstance(palette, ColorConverter):
-                    converted = palette.convert(pixel)
-                    converted_888 = rgb565_to_rgb888(converted)
-                    color = converted_888
-
-                for _ in range(3):
-                    row_buffer[buffer_index] = color & 0xFF
-                    color >>= 8
-                    buffer_index += 1
+            row = y - 1
+            if use_palette:
+                for x in range(width):
+                    pack_into("<I", out_buf, buffer_index, palette[pixel_source[x, row]])
+                    buffer_index += 3
+            else:
+                convert = palette.convert
+                for x in range(width):
+                    color = rgb565_to_rgb888(convert(pixel_source[x, row]))
+                    pack_into("<I", out_buf, buffer_index, color)
+                    buffer_index += 3
         else:
             # pixel_source: display
-            result_buffer = bytearray(2048)
             data = pixel_source.fill_row(y - 1, result_buffer)
-            for i in range(width):
-                pixel565 = (data[i * 2] << 8) + data[i * 2 + 1]
-                for b in _rgb565_to_bgr_tuple(pixel565):
-                    row_buffer[buffer_index] = b & 0xFF
-                    buffer_index += 1
-        output_file.write(row_buffer)
-        if result_buffer:
-            for i in range(width * 2):
-                result_buffer[i] = 0
-        gc.collect()
+            # Big-endian rgb565 split straight into B, G, R bytes, with no
+            # intermediate int or tuple per pixel
+            for i in range(0, width * 2, 2):
+                high = data[i]
+                low = data[i + 1]
+                out_buf[buffer_index] = (low << 3) & 0xF8
+                out_buf[buffer_index + 1] = ((high << 5) | (low >> 3)) & 0xFC
+                out_buf[buffer_index + 2] = high & 0xF8
+                buffer_index += 3
+        offset += row_bytes
+        if offset == batch_bytes:
+            output_file.write(out_view[:offset])
+            offset = 0
+    if offset:
+        output_file.write(out_view[:offset])
+    # Once per save, not per row: each collect walks the whole heap
+    gc.collect()
 
 
 def save_pixels(
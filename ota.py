@@ -419,32 +419,30 @@ class StageTwo_OTA:
     
     def _walk_directory(self, path):
         """Walk directory tree (simple implementation for CircuitPython)"""
-        try:
-            items = os.listdir(path)
+        # Explicit stack instead of nested generators keeps deep trees off the call stack
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            try:
+                items = os.listdir(current)
+            except Exception as e:
+                self._update_status(f"Error walking directory {current}: {e}")
+                continue
+            
             files = []
             dirs = []
-            
             for item in items:
-                item_path = f"{path}/{item}"
-                try:
-                    # Try to list directory to see if it's a directory
-                    os.listdir(item_path)
+                if self._dir_exists(f"{current}/{item}"):
                     dirs.append(item)
-                except OSError:
-                    # Not a directory, must be a file
+                else:
                     files.append(item)
             
             # Yield current directory
-            yield path, dirs, files
+            yield current, dirs, files
             
-            # Recursively walk subdirectories
-            for dir_name in dirs:
-                dir_path = f"{path}/{dir_name}"
-                for result in self._walk_directory(dir_path):
-                    yield result
-                    
-        except Exception as e:
-            self._update_status(f"Error walking directory {path}: {e}")
+            # Queue subdirectories, reversed so they pop in listing order
+            for dir_name in reversed(dirs):
+                stack.append(f"{current}/{dir_name}")
     
     def _should_update_file(self, source_path, target_path):
         """Determine if file should be updated based on version"""
@@ -453,11 +451,8 @@ class StageTwo_OTA:
             if not self._file_exists(target_path):
                 return True
             
-            # Read source content to get version
-            with open(source_path, 'r') as f:
-                source_content = f.read()
-            
-            source_version = VersionManager.extract_version_from_content(source_content)
+            # Only the file head is needed for the version, same as for the target
+            source_version = VersionManager.extract_version_from_file(source_path)
             target_version = VersionManager.extract_version_from_file(target_path)
             
             # If we can't determine versions, update anyway (safer)
@@ -493,23 +488,35 @@ class StageTwo_OTA:
         except OSError:
             return False
     
+    def _dir_exists(self, path):
+        """Check if directory exists (stat only, no listing)"""
+        try:
+            return (os.stat(path)[0] & 0x4000) != 0
+        except OSError:
+            return False
+    
     def _ensure_directory_exists(self, path):
         """Ensure directory exists, creating if necessary"""
         if not path or path == '/':
             return
         
+        # Single mkdir attempt; EEXIST means there is nothing more to do
         try:
-            os.listdir(path)
+            os.mkdir(path)
+            return
+        except OSError as e:
+            if e.errno == 17 or self._dir_exists(path):
+                return
+        
+        # Parent is missing - create it, then retry
+        parent = '/'.join(path.split('/')[:-1])
+        if parent and parent != '/':
+            self._ensure_directory_exists(parent)
+        
+        try:
+            os.mkdir(path)
         except OSError:
-            # Directory doesn't exist, create it
-            parent = '/'.join(path.split('/')[:-1])
-            if parent and parent != '/':
-                self._ensure_directory_exists(parent)
-            
-            try:
-                os.mkdir(path)
-            except OSError:
-                pass  # May have been created by another process
+            pass  # May have been created by another process
     
     def _copy_file(self, source, destination):
         """Copy file from source to destination"""
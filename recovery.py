@@ -49,11 +49,29 @@ try:
     from boot import set_nvm_flag, RECOVERY_FLAG_ADDR, show_status
 except ImportError:
     def set_nvm_flag(addr, val):
-        microcontroller.nvm[addr] = 1 if val else 0
+        # Skip the flash write when the byte already holds the value
+        value = 1 if val else 0
+        if microcontroller.nvm[addr] != value:
+            microcontroller.nvm[addr] = value
     RECOVERY_FLAG_ADDR = 0
     def show_status():
         print("Status unavailable")
 
+# NVM flag block cleared by recovery and factory reset
+NVM_FLAG_BYTES = 10
+
+def clear_nvm_flags(count=NVM_FLAG_BYTES):
+    """Zero the first count NVM flag bytes with a single slice write"""
+    # Every NVM store can cost a flash erase/program cycle, so write once
+    zeros = bytes(count)
+    if microcontroller.nvm[0:count] == zeros:
+        return
+    try:
+        microcontroller.nvm[0:count] = zeros
+    except (TypeError, NotImplementedError):
+        for i in range(count):
+            microcontroller.nvm[i] = 0
+
 # Core system manifest - essential files for basic operation
 CORE_MANIFEST = {
     "boot.py": {"required": True, "description": "Boot loader"},
@@ -64,6 +82,22 @@ CORE_MANIFEST = {
     "lib/": {"required": True, "description": "Libraries directory"},
 }
 
+def _missing_core_files(root_entries):
+    """Return required CORE_MANIFEST entries absent from a root listing set"""
+    missing_files = []
+    for file_path, info in CORE_MANIFEST.items():
+        if info.get("required", False):
+            name = file_path.rstrip("/")
+            if "/" not in name:
+                if name not in root_entries:
+                    missing_files.append(file_path)
+                continue
+            try:
+                os.stat(name)
+            except OSError:
+                missing_files.append(file_path)
+    return missing_files
+
 class StatusBar:
     """Status bar for recovery system"""
     
@@ -192,6 +226,11 @@ class RecoverySystem:
         if len(self.status_messages) > 20:
             self.status_messages.pop(0)
     
+    def _get_filename(self, path):
+        """Return the last path component without splitting the whole path"""
+        i = path.rfind('/')
+        return path if i < 0 else path[i + 1:]
+    
     def show_message(self, message, color=0xFFFFFF, duration=None):
         """Show a message on screen"""
         # Clear main group but keep status bar
@@ -342,22 +381,26 @@ class RecoverySystem:
             self.run_action(index)
         # Return to menu on any other input
     
+    def _remount_writable(self):
+        """Remount / read-write for a write path; report when that isn't possible"""
+        # filesystem_check_silent stays read-only, so each write path has to
+        # remount for itself; this fails while USB has the drive mounted
+        try:
+            storage.remount("/", readonly=False)
+            return True
+        except Exception as e:
+            self.log_message(f"Remount failed: {e}")
+            self.status_bar.set_status("Filesystem read-only", 0xFF0000)
+            self.show_message("Filesystem is read-only\n\nUSB attached? Eject the\nCIRCUITPY drive and retry\n\nPress button to continue", 0xFF0000)
+            self._wait_for_button_action()
+            return False
+    
     def filesystem_check_silent(self):
         """Silent filesystem check for status indicator"""
         try:
-            storage.remount("/", readonly=False)
-            missing_files = []
-            
-            for file_path, info in CORE_MANIFEST.items():
-                if info.get("required", False):
-                    try:
-                        if file_path.endswith("/"):
-                            os.listdir(file_path)
-                        else:
-                            os.stat(file_path)
-                    except OSError:
-                        missing_files.append(file_path)
-            
+            # Runs on every menu redraw: answer top-level entries from one
+            # root listing instead of a stat/listdir per manifest entry
+            missing_files = _missing_core_files(set(os.listdir("/")))
             return len(missing_files) == 0, missing_files
         except Exception:
             return False, []
@@ -514,6 +557,9 @@ class RecoverySystem:
             self.show_message("Restoration cancelled", 0xFF8000, 1)
             return
         
+        if not self._remount_writable():
+            return
+        
         try:
             self.log_message(f"Restoring from {backup_path}")
             
@@ -551,6 +597,9 @@ class RecoverySystem:
             self._wait_for_button_action()
             return
         
+        if not self._remount_writable():
+            return
+        
         self.show_message("Web Recovery System\n\nInitializing WiFi...", 0x00FFFF)
         
         try:
@@ -596,13 +645,12 @@ class RecoverySystem:
             
             for i, url in enumerate(recovery_urls):
                 try:
-                    self.show_message(f"Downloading...\n{i+1}/{len(recovery_urls)}\n{url.split('/')[-1][:20]}", 0x00FFFF)
+                    filename = self._get_filename(url)
+                    self.show_message(f"Downloading...\n{i+1}/{len(recovery_urls)}\n{filename[:20]}", 0x00FFFF)
                     
                     response = requests.get(url, timeout=30)
                     
                     if response.status_code == 200:
-                        filename = url.split('/')[-1]
-                        
                         # Save file
                         if filename.endswith('.zip'):
                             save_path = f"/recovery/{filename}"
@@ -675,13 +723,15 @@ class RecoverySystem:
             except Exception:
                 status_info += "CPU: Info unavailable\n"
             
-            # WiFi status
+            # WiFi status (radio properties query the driver, so read each once)
             if WIFI_AVAILABLE:
                 try:
-                    if wifi.radio.connected:
+                    radio = wifi.radio
+                    if radio.connected:
+                        ap_info = radio.ap_info
                         status_info += f"WiFi: Connected\n"
-                        status_info += f"  SSID: {wifi.radio.ap_info.ssid}\n"
-                        status_info += f"  IP: {wifi.radio.ipv4_address}\n"
+                        status_info += f"  SSID: {ap_info.ssid if ap_info else '?'}\n"
+                        status_info += f"  IP: {radio.ipv4_address}\n"
                     else:
                         status_info += "WiFi: Disconnected\n"
                 except Exception:
@@ -691,7 +741,7 @@ class RecoverySystem:
             
             # NVM flags status
             try:
-                nvm_data = microcontroller.nvm
+                nvm_data = microcontroller.nvm[0:3]  # One NVM read for all three flags
                 status_info += f"\nNVM Flags:\n"
                 status_info += f"  Recovery: {bool(nvm_data[0])}\n"
                 status_info += f"  Developer: {bool(nvm_data[1])}\n"
@@ -731,8 +781,7 @@ class RecoverySystem:
         
         try:
             # Clear all flags
-            for i in range(10):  # Clear first 10 bytes
-                set_nvm_flag(i, False)
+            clear_nvm_flags()
             
             self.log_message("All flags cleared")
             self.status_bar.set_status("Flags cleared", 0x00FF00)
@@ -756,6 +805,9 @@ class RecoverySystem:
             self._wait_for_button_action()
             return
         
+        if not self._remount_writable():
+            return
+        
         self.show_message("System Backup\n\nPreparing backup...", 0x00FFFF)
         
         try:
@@ -839,7 +891,7 @@ class RecoverySystem:
                 if backup_size > 0:
                     self.log_message(f"Backup created: {backup_filename} ({backup_size} bytes)")
                     self.status_bar.set_status("Backup complete", 0x00FF00)
-                    self.show_message(f"Backup created!\n\nFile: {backup_filename.split('/')[-1]}\nSize: {backup_size} bytes\n\nPress button to continue", 0x00FF00)
+                    self.show_message(f"Backup created!\n\nFile: {self._get_filename(backup_filename)}\nSize: {backup_size} bytes\n\nPress button to continue", 0x00FF00)
                 else:
                     raise Exception("Backup file is empty")
                     
@@ -876,6 +928,9 @@ class RecoverySystem:
             self.show_message("Factory reset cancelled", 0xFF8000, 1)
             return
         
+        if not self._remount_writable():
+            return
+        
         try:
             self.show_message("FACTORY RESET IN PROGRESS\n\nDO NOT POWER OFF!\n\nDeleting files...", 0xFF0000)
             
@@ -920,8 +975,7 @@ class RecoverySystem:
             
             # Clear all NVM flags
             try:
-                for i in range(10):
-                    set_nvm_flag(i, False)
+                clear_nvm_flags()
             except Exception:
                 pass
             
@@ -1201,14 +1255,19 @@ def emergency_recovery():
         # Basic system check without GUI
         print("Checking critical files...")
         
-        critical_files = ["boot.py", "code.py"]
+        critical_files = ("boot.py", "code.py")
         missing_files = []
         
+        # One root listing answers every check instead of a stat per file
+        try:
+            root_entries = set(os.listdir("/"))
+        except OSError:
+            root_entries = set()
+        
         for file in critical_files:
-            try:
-                os.stat(file)
+            if file in root_entries:
                 print(f"✅ {file} - OK")
-            except OSError:
+            else:
                 print(f"❌ {file} - MISSING")
                 missing_files.append(file)
         
@@ -1250,9 +1309,7 @@ except Exception as e:
         
         # Clear any problematic flags
         try:
-            import microcontroller
-            for i in range(5):
-                microcontroller.nvm[i] = 0
+            clear_nvm_flags(5)
             print("✅ Cleared system flags")
         except Exception as e:
             print(f"⚠️ Flag clear failed: {e}")
@@ -1284,8 +1341,7 @@ def quick_fix():
     
     # Fix 2: Clear problematic flags
     try:
-        import microcontroller
-        microcontroller.nvm[0] = 0  # Clear recovery flag
+        set_nvm_flag(RECOVERY_FLAG_ADDR, False)  # Clear recovery flag
         print("✅ Recovery flag cleared")
         fixes_applied += 1
     except Exception as e:
@@ -1303,7 +1359,7 @@ def quick_fix():
     
     # Fix 4: Basic settings file
     try:
-        if not os.path.exists("/settings.toml"):
+        if "settings.toml" not in os.listdir("/"):
             with open("/settings.toml", "w") as f:
                 f.write("""# Basic settings
 CIRCUITPY_WIFI_SSID = ""
@@ -1325,12 +1381,23 @@ SCREENSAVER_TIMEOUT = 300
 def check_system_health():
     """Quick system health check"""
     try:
-        recovery = RecoverySystem()
-        fs_ok, missing = recovery.filesystem_check_silent()
+        # One root listing answers both the core file checks and whether the
+        # SD mount point exists; no RecoverySystem (display/button) needed
+        root_entries = set(os.listdir("/"))
+        missing = _missing_core_files(root_entries)
+        
+        sd_ok = False
+        if "sd" in root_entries:
+            try:
+                os.listdir("/sd")
+                sd_ok = True
+            except OSError:
+                pass
         
         health_status = {
-            "filesystem_ok": fs_ok,
+            "filesystem_ok": not missing,
             "missing_files": missing,
+            "sd_available": sd_ok,
             "memory_free": gc.mem_free(),
             "wifi_available": WIFI_AVAILABLE,
             "zipper_available": ZIPPER_AVAILABLE
@@ -1406,9 +1473,7 @@ def console_recovery():
             
             elif choice == "5":
                 try:
-                    import microcontroller
-                    for i in range(10):
-                        microcontroller.nvm[i] = 0
+                    clear_nvm_flags()
                     print("✅ All flags cleared")
                 except Exception as e:
                     print(f"❌ Flag clear failed: {e}")
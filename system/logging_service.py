@@ -24,11 +24,22 @@ LOG_LEVEL_NAMES = {
     LOG_LEVEL_CRITICAL: "CRITICAL"
 }
 
+# Shared category names, so call sites reuse one string object
+CAT_LOGGER = "LOGGER"
+CAT_SYSTEM = "SYSTEM"
+CAT_STARTUP = "STARTUP"
+CAT_EXPORT = "EXPORT"
+CAT_IMPORT = "IMPORT"
+CAT_PERF = "PERF"
+CAT_MEMORY = "MEMORY"
+
 # Default settings
 DEFAULT_LOG_LEVEL = LOG_LEVEL_INFO
 DEFAULT_MAX_FILE_SIZE = 50000  # 50KB
 DEFAULT_MAX_FILES = 5
 DEFAULT_BUFFER_SIZE = 1024
+DEFAULT_WRITE_BATCH_SIZE = 2048  # Bytes of pending lines per file write
+DEFAULT_FILE_BUFFER_SIZE = 4096  # Stream buffer requested for the log handle
 
 class LogRotator:
     """Handles log file rotation"""
@@ -37,16 +48,18 @@ class LogRotator:
         self.base_path = base_path
         self.max_files = max_files
     
+    def needs_rotation(self):
+        """Check whether the base log file has grown past the size limit"""
+        try:
+            return os.stat(self.base_path)[6] >= DEFAULT_MAX_FILE_SIZE
+        except OSError:
+            return False  # File doesn't exist
+    
     def rotate_logs(self):
         """Rotate log files when they get too large"""
         try:
-            # Check if base log file exists and get its size
-            try:
-                stat = os.stat(self.base_path)
-                if stat[6] < DEFAULT_MAX_FILE_SIZE:
-                    return False  # No rotation needed
-            except OSError:
-                return False  # File doesn't exist
+            if not self.needs_rotation():
+                return False  # No rotation needed
             
             print(f"Rotating logs: {self.base_path}")
             
@@ -136,6 +149,13 @@ class Logger:
         # File handling
         self.log_file_path = None
         self.rotator = None
+        self._fh = None  # Persistent append handle, opened once in _initialize
+        self._pending = []  # Lines waiting for the next batched write
+        self._pending_bytes = 0
+        
+        # Formatted timestamp, rebuilt only when the clock second changes
+        self._ts_second = None
+        self._ts_text = ""
         
         # Memory buffer
         self.buffer = LogBuffer()
@@ -163,62 +183,82 @@ class Logger:
             # Set up log rotator
             self.rotator = LogRotator(self.log_file_path)
             
-            # Test file writing
+            # Opening the append handle doubles as the write test
             if self.file_output:
                 self._test_file_writing()
             
             self.initialized = True
             
             # Log initialization
-            self._log_internal(LOG_LEVEL_INFO, "LOGGER", "Logging service initialized")
-            self._log_internal(LOG_LEVEL_INFO, "LOGGER", f"Log level: {LOG_LEVEL_NAMES[self.level]}")
-            self._log_internal(LOG_LEVEL_INFO, "LOGGER", f"Log directory: {self.log_dir}")
+            self._log_internal(LOG_LEVEL_INFO, CAT_LOGGER, "Logging service initialized")
+            self._log_internal(LOG_LEVEL_INFO, CAT_LOGGER, f"Log level: {LOG_LEVEL_NAMES[self.level]}")
+            self._log_internal(LOG_LEVEL_INFO, CAT_LOGGER, f"Log directory: {self.log_dir}")
             
         except Exception as e:
             print(f"Logger initialization failed: {e}")
             self.initialized = False
             self.file_output = False  # Disable file output on init failure
     
+    def _dir_exists(self, path):
+        """Check if path is an existing directory (stat only, no listing)"""
+        try:
+            return (os.stat(path)[0] & 0x4000) != 0
+        except OSError:
+            return False
+    
     def _ensure_log_directory(self):
         """Ensure log directory exists"""
+        if self._dir_exists(self.log_dir):
+            return
+        
+        # Directory doesn't exist, try to create it
         try:
-            # Check if directory exists
-            os.listdir(self.log_dir)
-        except OSError:
-            # Directory doesn't exist, try to create it
-            try:
-                # Create parent directories if needed
-                parts = self.log_dir.strip("/").split("/")
-                current_path = ""
-                
-                for part in parts:
-                    if part:
-                        current_path += "/" + part
-                        try:
-                            os.listdir(current_path)
-                        except OSError:
-                            os.mkdir(current_path)
-                
-            except Exception as e:
-                raise Exception(f"Cannot create log directory {self.log_dir}: {e}")
+            # Create parent directories if needed
+            parts = self.log_dir.strip("/").split("/")
+            current_path = ""
+            
+            for part in parts:
+                if part:
+                    current_path += "/" + part
+                    # Try mkdir first; only look further if it didn't say EEXIST
+                    try:
+                        os.mkdir(current_path)
+                    except OSError as e:
+                        if e.errno != 17 and not self._dir_exists(current_path):
+                            raise
+            
+        except Exception as e:
+            raise Exception(f"Cannot create log directory {self.log_dir}: {e}")
     
     def _test_file_writing(self):
         """Test if we can write to log files"""
+        # Opening for append fails on a read-only mount just like a scratch
+        # file would, without creating and deleting one on every boot
         try:
-            test_file = f"{self.log_dir}/test_write.tmp"
-            with open(test_file, "w") as f:
-                f.write("test")
-            os.remove(test_file)
+            if self._fh is None:
+                self._fh = self._open_log()
         except Exception as e:
             print(f"File writing test failed: {e}")
             self.file_output = False
     
+    def _open_log(self):
+        """Open the log file for append with a larger write buffer when supported"""
+        try:
+            return open(self.log_file_path, "a", buffering=DEFAULT_FILE_BUFFER_SIZE)
+        except TypeError:
+            # Port doesn't take buffering=; the pending-line batch still coalesces writes
+            return open(self.log_file_path, "a")
+    
     def _format_timestamp(self):
         """Format current timestamp"""
         try:
-            current_time = time.localtime()
-            return f"{current_time[0]:04d}-{current_time[1]:02d}-{current_time[2]:02d} " \
-                   f"{current_time[3]:02d}:{current_time[4]:02d}:{current_time[5]:02d}"
+            now = time.time()
+            if now != self._ts_second:
+                current_time = time.localtime(now)
+                self._ts_text = f"{current_time[0]:04d}-{current_time[1]:02d}-{current_time[2]:02d} " \
+                                f"{current_time[3]:02d}:{current_time[4]:02d}:{current_time[5]:02d}"
+                self._ts_second = now
+            return self._ts_text
         except:
             # Fallback to monotonic time if RTC not available
             return f"T+{time.monotonic():.1f}"
@@ -229,12 +269,16 @@ class Logger:
         level_name = LOG_LEVEL_NAMES.get(level, "UNKNOWN")
         return f"[{timestamp}] [{level_name}] {category}: {message}"
     
-    def _log_internal(self, level, category, message):
+    def _log_internal(self, level, category, message, args=()):
         """Internal logging method"""
         if level < self.level:
             return  # Below log level threshold
         
         try:
+            # %-style arguments are only formatted once the level has passed
+            if args:
+                message = message % args
+            
             # Format the entry
             entry = self._format_entry(level, category, message)
             
@@ -248,7 +292,7 @@ class Logger:
             
             # File output
             if self.file_output and self.log_file_path:
-                self._write_to_file(entry)
+                self._write_to_file(entry, level)
             
             # Update statistics
             self.stats["entries_logged"] += 1
@@ -262,20 +306,43 @@ class Logger:
             self.stats["last_error"] = str(e)
             print(f"Logging error: {e}")
     
-    def _write_to_file(self, entry):
-        """Write entry to log file"""
+    def _write_to_file(self, entry, level=LOG_LEVEL_INFO):
+        """Queue entry for the log file, writing out in batches"""
+        line = entry + "\n"
+        self._pending.append(line)
+        self._pending_bytes += len(line)
+        
+        # Warnings and up go out immediately so they survive a crash
+        if level >= LOG_LEVEL_WARN or self._pending_bytes >= DEFAULT_WRITE_BATCH_SIZE:
+            self._flush_pending()
+    
+    def _flush_pending(self):
+        """Write all queued lines to the log file in one call"""
+        if not self._pending:
+            return True
+        
         try:
-            # Check if rotation is needed
-            if self.rotator:
+            # Check if rotation is needed (files can't be renamed while open)
+            if self.rotator and self.rotator.needs_rotation():
+                self._close_handle()
                 self.rotator.rotate_logs()
             
-            # Write to file
-            with open(self.log_file_path, "a") as f:
-                f.write(entry + "\n")
+            if self._fh is None:
+                self._fh = self._open_log()
+            
+            self._fh.write("".join(self._pending))
+            self._fh.flush()
+            return True
             
         except Exception as e:
             print(f"File write error: {e}")
             self.file_output = False  # Disable file output on error
+            self._close_handle()
+            return False
+        
+        finally:
+            self._pending.clear()
+            self._pending_bytes = 0
     
     def _maintenance(self):
         """Periodic maintenance tasks"""
@@ -283,56 +350,81 @@ class Logger:
             # Garbage collection
             gc.collect()
             
-            # Flush buffer if it's getting large
-            if self.buffer.total_size > DEFAULT_BUFFER_SIZE * 0.8:
-                if self.file_output and self.log_file_path:
-                    self.buffer.flush_to_file(self.log_file_path)
-            
         except Exception as e:
             print(f"Maintenance error: {e}")
     
     # Public logging methods
-    def debug(self, category, message):
+    def debug(self, category, message, *args):
         """Log debug message"""
-        self._log_internal(LOG_LEVEL_DEBUG, category, message)
+        self._log_internal(LOG_LEVEL_DEBUG, category, message, args)
     
-    def info(self, category, message):
+    def info(self, category, message, *args):
         """Log info message"""
-        self._log_internal(LOG_LEVEL_INFO, category, message)
+        self._log_internal(LOG_LEVEL_INFO, category, message, args)
     
-    def warn(self, category, message):
+    def warn(self, category, message, *args):
         """Log warning message"""
-        self._log_internal(LOG_LEVEL_WARN, category, message)
+        self._log_internal(LOG_LEVEL_WARN, category, message, args)
     
-    def error(self, category, message):
+    def error(self, category, message, *args):
         """Log error message"""
-        self._log_internal(LOG_LEVEL_ERROR, category, message)
+        self._log_internal(LOG_LEVEL_ERROR, category, message, args)
     
-    def critical(self, category, message):
+    def critical(self, category, message, *args):
         """Log critical message"""
-        self._log_internal(LOG_LEVEL_CRITICAL, category, message)
+        self._log_internal(LOG_LEVEL_CRITICAL, category, message, args)
     
-    def log(self, level, category, message):
+    def log(self, level, category, message, *args):
         """Log message at specified level"""
-        self._log_internal(level, category, message)
+        self._log_internal(level, category, message, args)
+    
+    def log_lines(self, level, category, lines):
+        """Log several messages with one level check, timestamp and write"""
+        if level < self.level or not lines:
+            return
+        
+        try:
+            prefix = f"[{self._format_timestamp()}] [{LOG_LEVEL_NAMES.get(level, 'UNKNOWN')}] {category}: "
+            entries = [prefix + line for line in lines]
+            
+            if self.console_output:
+                print("\n".join(entries))
+            
+            if self.buffer_output:
+                for entry in entries:
+                    self.buffer.add(entry)
+            
+            # One queued chunk, so the block reaches the file in a single write
+            if self.file_output and self.log_file_path:
+                self._write_to_file("\n".join(entries), level)
+            
+            before = self.stats["entries_logged"]
+            self.stats["entries_logged"] = before + len(entries)
+            if before // 50 != self.stats["entries_logged"] // 50:
+                self._maintenance()
+            
+        except Exception as e:
+            self.stats["errors"] += 1
+            self.stats["last_error"] = str(e)
+            print(f"Logging error: {e}")
     
     # Configuration methods
     def set_level(self, level):
         """Set logging level"""
         self.level = level
-        self.info("LOGGER", f"Log level changed to {LOG_LEVEL_NAMES[level]}")
+        self.info(CAT_LOGGER, "Log level changed to %s", LOG_LEVEL_NAMES[level])
     
     def set_console_output(self, enabled):
         """Enable/disable console output"""
         self.console_output = enabled
-        self.info("LOGGER", f"Console output {'enabled' if enabled else 'disabled'}")
+        self.info(CAT_LOGGER, "Console output %s", "enabled" if enabled else "disabled")
     
     def set_file_output(self, enabled):
         """Enable/disable file output"""
         if enabled and not self.file_output:
             self._test_file_writing()
         self.file_output = enabled
-        self.info("LOGGER", f"File output {'enabled' if enabled else 'disabled'}")
+        self.info(CAT_LOGGER, "File output %s", "enabled" if enabled else "disabled")
     
     # Utility methods
     def get_stats(self):
@@ -351,15 +443,35 @@ class Logger:
     
     def flush(self):
         """Flush all pending log entries"""
-        if self.file_output and self.log_file_path:
-            return self.buffer.flush_to_file(self.log_file_path)
+        if self._pending and not self._flush_pending():
+            return False
+        if self._fh:
+            try:
+                self._fh.flush()
+            except Exception as e:
+                print(f"Log flush error: {e}")
+                return False
         return True
     
+    def close(self):
+        """Flush and close the log file handle (call before reset/reload)"""
+        self._flush_pending()
+        self._close_handle()
+    
+    def _close_handle(self):
+        """Close the log file handle without writing queued lines"""
+        if self._fh:
+            try:
+                self._fh.close()
+            except Exception:
+                pass
+            self._fh = None
+    
     def cleanup(self):
         """Clean up logging resources"""
         try:
-            self.flush()
-            self.info("LOGGER", "Logging service shutting down")
+            self.info(CAT_LOGGER, "Logging service shutting down")
+            self.close()
         except:
             pass
 
@@ -382,40 +494,48 @@ def get_logger():
     return _global_logger
 
 # Convenience functions for global logger
-def log_debug(category, message):
+def log_debug(category, message, *args):
     """Log debug message to global logger"""
     if _global_logger:
-        _global_logger.debug(category, message)
+        _global_logger.debug(category, message, *args)
     else:
-        print(f"[DEBUG] {category}: {message}")
+        print(f"[DEBUG] {category}: {message % args if args else message}")
 
-def log_info(category, message):
+def log_info(category, message, *args):
     """Log info message to global logger"""
     if _global_logger:
-        _global_logger.info(category, message)
+        _global_logger.info(category, message, *args)
     else:
-        print(f"[INFO] {category}: {message}")
+        print(f"[INFO] {category}: {message % args if args else message}")
 
-def log_warn(category, message):
+def log_warn(category, message, *args):
     """Log warning message to global logger"""
     if _global_logger:
-        _global_logger.warn(category, message)
+        _global_logger.warn(category, message, *args)
     else:
-        print(f"[WARN] {category}: {message}")
+        print(f"[WARN] {category}: {message % args if args else message}")
 
-def log_error(category, message):
+def log_error(category, message, *args):
     """Log error message to global logger"""
     if _global_logger:
-        _global_logger.error(category, message)
+        _global_logger.error(category, message, *args)
     else:
-        print(f"[ERROR] {category}: {message}")
+        print(f"[ERROR] {category}: {message % args if args else message}")
 
-def log_critical(category, message):
+def log_critical(category, message, *args):
     """Log critical message to global logger"""
     if _global_logger:
-        _global_logger.critical(category, message)
+        _global_logger.critical(category, message, *args)
+    else:
+        print(f"[CRITICAL] {category}: {message % args if args else message}")
+
+def log_lines(level, category, lines):
+    """Log a block of messages to global logger in one write"""
+    if _global_logger:
+        _global_logger.log_lines(level, category, lines)
     else:
-        print(f"[CRITICAL] {category}: {message}")
+        for line in lines:
+            print(f"[{LOG_LEVEL_NAMES.get(level, 'UNKNOWN')}] {category}: {line}")
 
 def flush_logs():
     """Flush all pending logs"""
@@ -616,11 +736,11 @@ def export_logs_to_json(output_path="/sd/logs_export.json"):
         with open(output_path, "w") as f:
             json.dump(export_data, f)
         
-        log_info("EXPORT", f"Logs exported to {output_path}")
+        log_info(CAT_EXPORT, "Logs exported to %s", output_path)
         return True
         
     except Exception as e:
-        log_error("EXPORT", f"Failed to export logs: {e}")
+        log_error(CAT_EXPORT, "Failed to export logs: %s", e)
         return False
 
 def import_logs_from_json(input_path="/sd/logs_export.json"):
@@ -635,11 +755,11 @@ def import_logs_from_json(input_path="/sd/logs_export.json"):
             for entry in imported_logs:
                 _global_logger.buffer.add(f"[IMPORTED] {entry}")
         
-        log_info("IMPORT", f"Imported {len(imported_logs)} log entries")
+        log_info(CAT_IMPORT, "Imported %d log entries", len(imported_logs))
         return True
         
     except Exception as e:
-        log_error("IMPORT", f"Failed to import logs: {e}")
+        log_error(CAT_IMPORT, "Failed to import logs: %s", e)
         return False
 
 # System integration utilities
@@ -653,7 +773,7 @@ def setup_system_logging():
             try:
                 logger = init_logging(log_dir, "medusa_system", LOG_LEVEL_INFO)
                 if logger and logger.initialized:
-                    log_info("SYSTEM", f"System logging initialized: {log_dir}")
+                    log_info(CAT_SYSTEM, "System logging initialized: %s", log_dir)
                     return logger
             except Exception as e:
                 print(f"Failed to initialize logging in {log_dir}: {e}")
@@ -672,39 +792,42 @@ def log_system_startup():
         import board
         import microcontroller
         
-        log_info("STARTUP", "=== MEDUSA SYSTEM STARTUP ===")
-        log_info("STARTUP", f"Board: {board.board_id}")
-        log_info("STARTUP", f"Free memory: {gc.mem_free()} bytes")
+        # Collect the INFO banner and log it as one block
+        lines = [
+            "=== MEDUSA SYSTEM STARTUP ===",
+            f"Board: {board.board_id}",
+            f"Free memory: {gc.mem_free()} bytes",
+        ]
         
         # Log NVM status
         try:
-            recovery_flag = microcontroller.nvm[0]
-            boot_mode = microcontroller.nvm[1]
-            dev_mode = microcontroller.nvm[2]
+            recovery_flag, boot_mode, dev_mode = microcontroller.nvm[0:3]
             
-            log_info("STARTUP", f"NVM Recovery Flag: {recovery_flag}")
-            log_info("STARTUP", f"NVM Boot Mode: {boot_mode}")
-            log_info("STARTUP", f"NVM Developer Mode: {dev_mode}")
+            lines.append(f"NVM Recovery Flag: {recovery_flag}")
+            lines.append(f"NVM Boot Mode: {boot_mode}")
+            lines.append(f"NVM Developer Mode: {dev_mode}")
         except Exception as e:
-            log_warn("STARTUP", f"Could not read NVM: {e}")
+            log_warn(CAT_STARTUP, "Could not read NVM: %s", e)
         
         # Log filesystem status
         try:
             flash_files = len(os.listdir("/"))
-            log_info("STARTUP", f"Flash filesystem: {flash_files} items")
+            lines.append(f"Flash filesystem: {flash_files} items")
         except Exception as e:
-            log_warn("STARTUP", f"Flash filesystem error: {e}")
+            log_warn(CAT_STARTUP, "Flash filesystem error: %s", e)
         
         try:
             sd_files = len(os.listdir("/sd"))
-            log_info("STARTUP", f"SD filesystem: {sd_files} items")
+            lines.append(f"SD filesystem: {sd_files} items")
         except Exception as e:
-            log_warn("STARTUP", f"SD filesystem not available: {e}")
+            log_warn(CAT_STARTUP, "SD filesystem not available: %s", e)
         
-        log_info("STARTUP", "=== STARTUP LOGGING COMPLETE ===")
+        lines.append("=== STARTUP LOGGING COMPLETE ===")
+        log_lines(LOG_LEVEL_INFO, CAT_STARTUP, lines)
+        flush_logs()
         
     except Exception as e:
-        log_error("STARTUP", f"Startup logging failed: {e}")
+        log_error(CAT_STARTUP, "Startup logging failed: %s", e)
 
 # Performance monitoring
 class PerformanceLogger:
@@ -717,21 +840,21 @@ class PerformanceLogger:
         """Start timing an operation"""
         self.start_times[operation] = time.monotonic()
     
-    def end_timer(self, operation, category="PERF"):
+    def end_timer(self, operation, category=CAT_PERF):
         """End timing and log the result"""
         if operation in self.start_times:
             duration = time.monotonic() - self.start_times[operation]
-            log_info(category, f"{operation} completed in {duration:.3f}s")
+            log_info(category, "%s completed in %.3fs", operation, duration)
             del self.start_times[operation]
             return duration
         else:
-            log_warn(category, f"Timer for {operation} was not started")
+            log_warn(category, "Timer for %s was not started", operation)
             return None
     
-    def log_memory_usage(self, operation="", category="MEMORY"):
+    def log_memory_usage(self, operation="", category=CAT_MEMORY):
         """Log current memory usage"""
         free_mem = gc.mem_free()
-        log_info(category, f"Memory usage{' after ' + operation if operation else ''}: {free_mem} bytes free")
+        log_info(category, "Memory usage%s: %d bytes free", " after " + operation if operation else "", free_mem)
         return free_mem
 
 # Global performance logger
@@ -741,11 +864,11 @@ def start_performance_timer(operation):
     """Start performance timer"""
     _perf_logger.start_timer(operation)
 
-def end_performance_timer(operation, category="PERF"):
+def end_performance_timer(operation, category=CAT_PERF):
     """End performance timer"""
     return _perf_logger.end_timer(operation, category)
 
-def log_memory_usage(operation="", category="MEMORY"):
+def log_memory_usage(operation="", category=CAT_MEMORY):
     """Log memory usage"""
     return _perf_logger.log_memory_usage(operation, category)
 
@@ -753,23 +876,23 @@ def log_memory_usage(operation="", category="MEMORY"):
 class LoggedOperation:
     """Context manager for logging operation performance"""
     
-    def __init__(self, operation_name, category="PERF"):
+    def __init__(self, operation_name, category=CAT_PERF):
         self.operation_name = operation_name
         self.category = category
         self.start_time = None
     
     def __enter__(self):
         self.start_time = time.monotonic()
-        log_debug(self.category, f"Starting {self.operation_name}")
+        log_debug(self.category, "Starting %s", self.operation_name)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         duration = time.monotonic() - self.start_time
         
         if exc_type is None:
-            log_info(self.category, f"{self.operation_name} completed in {duration:.3f}s")
+            log_info(self.category, "%s completed in %.3fs", self.operation_name, duration)
         else:
-            log_error(self.category, f"{self.operation_name} failed after {duration:.3f}s: {exc_val}")
+            log_error(self.category, "%s failed after %.3fs: %s", self.operation_name, duration, exc_val)
 
 # Export all public functions and classes
 __all__ = [
@@ -777,7 +900,7 @@ __all__ = [
     'Logger', 'init_logging', 'get_logger',
     
     # Convenience functions
-    'log_debug', 'log_info', 'log_warn', 'log_error', 'log_critical',
+    'log_debug', 'log_info', 'log_warn', 'log_error', 'log_critical', 'log_lines',
     'flush_logs', 'get_log_stats', 'get_recent_logs', 'cleanup_logging',
     
     # Configuration
@@ -801,7 +924,9 @@ __all__ = [
     
     # Constants
     'LOG_LEVEL_DEBUG', 'LOG_LEVEL_INFO', 'LOG_LEVEL_WARN', 
-    'LOG_LEVEL_ERROR', 'LOG_LEVEL_CRITICAL'
+    'LOG_LEVEL_ERROR', 'LOG_LEVEL_CRITICAL',
+    'CAT_LOGGER', 'CAT_SYSTEM', 'CAT_STARTUP', 'CAT_EXPORT', 'CAT_IMPORT',
+    'CAT_PERF', 'CAT_MEMORY'
 ]
 
 print("Medusa Logging Service V2.0 loaded")
@@ -20,11 +20,32 @@ try:
     from boot import set_nvm_flag, RECOVERY_FLAG_ADDR, show_status
 except ImportError:
     def set_nvm_flag(addr, val):
-        microcontroller.nvm[addr] = 1 if val else 0
+        # Skip the flash write when the byte already holds the value
+        value = 1 if val else 0
+        if microcontroller.nvm[addr] != value:
+            microcontroller.nvm[addr] = value
     RECOVERY_FLAG_ADDR = 0
     def show_status():
         print("Status unavailable")
 
+# NVM flag block cleared by recovery and factory reset
+NVM_FLAG_BYTES = 10
+
+def clear_nvm_flags(count=NVM_FLAG_BYTES):
+    """Zero the first count NVM flag bytes with a single slice write"""
+    # Every NVM store can cost a flash erase/program cycle, so write once
+    zeros = bytes(count)
+    if microcontroller.nvm[0:count] == zeros:
+        return
+    try:
+        microcontroller.nvm[0:count] = zeros
+    except (TypeError, NotImplementedError):
+        for i in range(count):
+            microcontroller.nvm[i] = 0
+
+# Button hold that selects the current menu item
+LONG_PRESS_MS = 1000
+
 # Recovery menu items
 RECOVERY_MENU_ITEMS = [
     ("File System Check", "fs_check"),
@@ -64,6 +85,10 @@ class RecoverySystem:
 
         self.selected = 0
         self.status_messages = []
+        self._menu_group = None  # Built on first draw_menu
+        self._drawn_index = None  # Selection the shown menu reflects
+        self._press_start = None  # ticks_ms() when the current press began
+        self._long_fired = False
         self.clear_recovery_flag()
 
     def clear_recovery_flag(self):
@@ -76,10 +101,8 @@ class RecoverySystem:
         if len(self.status_messages) > 10:
             self.status_messages.pop(0)
 
-    def draw_menu(self, selected_index):
-        while len(self.group) > 0:
-            self.group.pop()
-
+    def _build_menu(self):
+        # Built once: one highlight bar and one label per item, updated in place
         menu_group = displayio.Group()
 
         # Title
@@ -88,25 +111,22 @@ class RecoverySystem:
         )
         menu_group.append(title)
 
+        # Highlight for the selected item, moved rather than reallocated
+        highlight_bitmap = displayio.Bitmap(200, 18, 1)
+        highlight_palette = displayio.Palette(1)
+        highlight_palette[0] = 0x330066  # dark magenta
+        self._highlight = displayio.TileGrid(
+            highlight_bitmap, pixel_shader=highlight_palette, x=5, y=30 - 10
+        )
+        menu_group.append(self._highlight)
+
         # Menu items
+        self._menu_labels = []
         for i, (item, _) in enumerate(RECOVERY_MENU_ITEMS):
-            y = 30 + i * 20
-            if i == selected_index:
-                # Highlight selected item
-                highlight_bitmap = displayio.Bitmap(200, 18, 1)
-                highlight_palette = displayio.Palette(1)
-                highlight_palette[0] = 0x330066  # dark magenta
-                highlight_tile = displayio.TileGrid(
-                    highlight_bitmap, pixel_shader=highlight_palette, x=5, y=y - 10
-                )
-                menu_group.append(highlight_tile)
-                color = 0xFFFF00  # yellow for selected
-            else:
-                color = 0xFFFFFF  # white
-
             text = label.Label(
-                terminalio.FONT, text=f"{i}: {item}", color=color, x=10, y=y
+                terminalio.FONT, text=f"{i}: {item}", color=0xFFFFFF, x=10, y=30 + i * 20
             )
+            self._menu_labels.append(text)
             menu_group.append(text)
 
         # Status area
@@ -116,7 +136,30 @@ class RecoverySystem:
         )
         menu_group.append(status_text)
 
-        self.group.append(menu_group)
+        self._menu_group = menu_group
+
+    def draw_menu(self, selected_index):
+        if self._menu_group is None:
+            self._build_menu()
+
+        showing = len(self.group) > 0 and self.group[0] is self._menu_group
+        # Callers redraw after every command or action; when the menu is
+        # still on screen with the same selection there is nothing to update
+        if showing and selected_index == self._drawn_index:
+            return
+        self._drawn_index = selected_index
+
+        for i, text in enumerate(self._menu_labels):
+            # yellow for selected, white otherwise
+            color = 0xFFFF00 if i == selected_index else 0xFFFFFF
+            if text.color != color:
+                text.color = color
+        self._highlight.y = 30 + selected_index * 20 - 10
+
+        if not showing:
+            while len(self.group) > 0:
+                self.group.pop()
+            self.group.append(self._menu_group)
 
     def show_progress(self, message, progress=None):
         while len(self.group) > 0:
@@ -229,7 +272,13 @@ class RecoverySystem:
                     except OSError:
                         pass
                     with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
-                        fdst.write(fsrc.read())
+                        # Stream in chunks so peak memory doesn't grow with
+                        # the file
+                        while True:
+                            chunk = fsrc.read(1024)
+                            if not chunk:
+                                break
+                            fdst.write(chunk)
                     self.log_message("settings.toml backed up to /sd/config/")
                 except OSError:
                     self.log_message("SD card or /sd/config not available, backup skipped")
@@ -309,8 +358,7 @@ class RecoverySystem:
     def clear_all_flags(self):
         self.show_progress("Clearing all flags...")
         try:
-            for i in range(10):
-                microcontroller.nvm[i] = 0
+            clear_nvm_flags()
             self.log_message("All flags cleared")
             return True
         except Exception as e:
@@ -404,9 +452,28 @@ class RecoverySystem:
                 break
             time.sleep(0.1)
 
+    def poll_button(self):
+        # One sample per loop tick: returns "long" once the button has been
+        # held for LONG_PRESS_MS, "short" on release before that, otherwise
+        # None. The 50 ms tick is longer than contact bounce, so it debounces too.
+        # Integer ticks don't allocate a float per poll or lose resolution
+        # with uptime; ticks_ms() wraps at 2**29
+        now = supervisor.ticks_ms()
+        if not self.button.value:
+            if self._press_start is None:
+                self._press_start = now
+                self._long_fired = False
+            elif not self._long_fired and (now - self._press_start) & 0x1FFFFFFF > LONG_PRESS_MS:
+                self._long_fired = True
+                return "long"
+        elif self._press_start is not None:
+            self._press_start = None
+            if not self._long_fired:
+                return "short"
+        return None
+
     def menu_loop(self):
         self.draw_menu(self.selected)
-        last_button = True if self.has_button else True
         self.log_message("Performing initial filesystem check...")
         fs_ok, missing = self.filesystem_check()
         if not fs_ok and missing:
@@ -448,21 +515,13 @@ class RecoverySystem:
                 except Exception:
                     pass
             if self.has_button:
-                current_button = self.button.value
-                if not current_button and last_button:
-                    time.sleep(0.05)
-                    if not self.button.value:
-                        press_start = time.monotonic()
-                        while not self.button.value:
-                            if time.monotonic() - press_start > 1.0:
-                                self.run_action(self.selected)
-                                self.draw_menu(self.selected)
-                                break
-                            time.sleep(0.1)
-                        else:
-                            self.selected = (self.selected + 1) % len(RECOVERY_MENU_ITEMS)
-                            self.draw_menu(self.selected)
-                last_button = current_button
+                action = self.poll_button()
+                if action == "long":
+                    self.run_action(self.selected)
+                    self.draw_menu(self.selected)
+                elif action == "short":
+                    self.selected = (self.selected + 1) % len(RECOVERY_MENU_ITEMS)
+                    self.draw_menu(self.selected)
             time.sleep(0.05)
             gc.collect()
 
@@ -497,8 +556,7 @@ def basic_recovery():
             choice = input("Select option (1-5): ").strip()
             if choice == "1":
                 try:
-                    for i in range(10):
-                        microcontroller.nvm[i] = 0
+                    clear_nvm_flags()
                     print("All flags cleared")
                     time.sleep(2)
                     microcontroller.reset()
@@ -521,8 +579,7 @@ def basic_recovery():
                 confirm = input("Factory reset will erase settings. Continue? (yes/no): ")
                 if confirm.lower() == "yes":
                     try:
-                        for i in range(10):
-                            microcontroller.nvm[i] = 0
+                        clear_nvm_flags()
                         try:
                             os.remove("settings.toml")
                         except Exception:
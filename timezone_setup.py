@@ -18,11 +18,19 @@ TIMEZONES = [
 
 import os
 
+def _file_exists(path):
+    # One stat on the path instead of listing the whole directory
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
 def save_settings(SETTINGS_PATH, timezone, dst, hour, minute):
     # Read existing lines if file exists
     lines = []
     keys_found = {"TIMEZONE": False, "DST": False, "MANUAL_HOUR": False, "MANUAL_MINUTE": False}
-    if SETTINGS_PATH in os.listdir("/"):
+    if _file_exists(SETTINGS_PATH):
         with open(SETTINGS_PATH, "r") as f:
             for line in f:
                 if line.startswith("TIMEZONE"):
@@ -2,6 +2,7 @@ import board
 import wifi
 import time
 import os
+import random
 import digitalio
 import displayio
 import terminalio
@@ -27,6 +28,20 @@ CHAR_GROUPS = [
     "0123456789!@#$%^&*()-_=+[]{};:',.<>/?\\|\"`~ "  # Numbers + symbols + space
 ]
 
+def _wait_connected(total_timeout=2):
+    """Poll for a WiFi link with growing intervals (0.1s doubling up to 1.6s)"""
+    interval = 0.1
+    waited = 0
+    while waited < total_timeout:
+        if getattr(wifi.radio, 'connected', False):
+            return True
+        # Never sleep past the timeout
+        step = min(interval, total_timeout - waited)
+        time.sleep(step)
+        waited += step
+        interval = min(interval * 2, 1.6)
+    return getattr(wifi.radio, 'connected', False)
+
 class StatusBar:
     def __init__(self, display_group):
         self.group = displayio.Group()
@@ -136,10 +151,18 @@ class StatusBar:
         self.update_wifi_status()
         self.update_time()
 
+def _file_exists(path):
+    """Check for a single path with one stat instead of listing its directory."""
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
 def load_settings():
     """Load all settings as a dict of key: value."""
     settings = {}
-    if SETTINGS_PATH in os.listdir("/"):
+    if _file_exists(SETTINGS_PATH):
         try:
             with open(SETTINGS_PATH, "r") as f:
                 for line in f:
@@ -995,16 +1018,17 @@ class WiFiConfigUI:
                 else:
                     raise Exception("Connect method not available")
                 
-                # Verify connection
-                time.sleep(2)  # Give it time to establish
-                if hasattr(wifi.radio, 'connected') and wifi.radio.connected:
+                # Verify connection, returning as soon as the link is up
+                if _wait_connected(2):
                     self.status_bar.set_status("Connected!", 0x00FF00)
                     return True
                     
             except Exception as e:
                 print(f"Connection attempt {attempt+1} failed: {e}")
-                if attempt < max_attempts - 1:
-                    time.sleep(2)  # Wait before retry
+            
+            # Exponential backoff with jitter before the next attempt
+            if attempt < max_attempts - 1:
+                time.sleep(min(60, 1 << attempt) + random.random() * 0.5)
         
         self.status_bar.set_status("Connection failed", 0xFF0000)
         return False